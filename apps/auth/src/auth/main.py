@@ -1,11 +1,24 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from auth.middlewares import log_requests
+from auth.logger import logger
+from auth.middlewares import LogRequestsMiddleware
 from auth.router import router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator:
+    yield
+    # The sink is enqueued, so wait for the records still in flight before the process exits
+    await logger.complete()
+
+
 app = FastAPI(
     title='Auth service.',
     description='A secure authentication service to verify user identity before granting access to the system.',
+    lifespan=lifespan,
 )
 
-app.middleware('http')(log_requests)
+app.add_middleware(LogRequestsMiddleware)
 app.include_router(router)
@@ -16,3 +16,9 @@ MONGO_PASSWORD = os.environ['MONGO_INITDB_ROOT_PASSWORD']
 MONGO_URL = f'mongodb://{MONGO_USERNAME}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}'
 
 pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+
+LOG_BODY_SAMPLE_RATE = float(os.getenv('LOG_BODY_SAMPLE_RATE', '0'))
+LOG_BODY_MAX_SIZE = int(os.getenv('LOG_BODY_MAX_SIZE', '4096'))
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_JSON = os.getenv('LOG_JSON', 'false').lower() in ('1', 'true', 'yes')
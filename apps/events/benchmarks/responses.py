@@ -0,0 +1,61 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy.orm import configure_mappers
+
+from events.domain.model import Event
+from events.entrypoints.fastapi.responses import EventResponse
+
+ITEMS = int(os.getenv('BENCH_ITEMS', '1000'))
+ROUNDS = int(os.getenv('BENCH_ROUNDS', '50'))
+
+
+async def pydantic_path(field, events: list[Event]) -> bytes:
+    content = await serialize_response(field=field, response_content=events)
+    return JSONResponse(content).body
+
+
+async def precompiled_path(field, events: list[Event]) -> bytes:
+    return EventResponse(events).body
+
+
+async def measure(name: str, path, field, events: list[Event]) -> bytes:
+    body = await path(field, events)
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await path(field, events)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    print(f'{name:<12} {elapsed * 1000:8.2f} ms/list {elapsed / len(events) * 1e6:8.2f} us/item')
+    return body
+
+
+async def main() -> None:
+    configure_mappers()
+    events = [
+        Event.model_construct(
+            id=i,
+            name=f'Event {i}',
+            description='Benchmark event',
+            event_datetime=datetime.now() + timedelta(days=1, minutes=i),
+            available_tickets=100,
+            ticket_price=Decimal('1500.50'),
+            deleted_at=None,
+        )
+        for i in range(ITEMS)
+    ]
+    field = create_model_field(name='Response_get_events', type_=list[Event], mode='serialization')
+
+    print(f'{ITEMS} items, {ROUNDS} rounds')
+    expected = await measure('pydantic', pydantic_path, field, events)
+    actual = await measure('precompiled', precompiled_path, field, events)
+    assert actual == expected, 'Responses differ'
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+import json
+import os
+import time
+from collections.abc import Callable
+
+from events.adapters.serialization import registry
+from events.domain import events
+
+MESSAGES = int(os.getenv('BENCH_MESSAGES', '100000'))
+
+
+def legacy_path(body: bytes) -> events.Event | None:
+    event_data = json.loads(body.decode())
+    event_class = getattr(events, event_data.pop('name'), None)
+    return event_class(**event_data) if event_class else None
+
+
+def registry_path(body: bytes) -> events.Event | None:
+    return registry.decode(body)
+
+
+def measure(name: str, path: Callable[[bytes], events.Event | None], bodies: list[bytes]) -> list:
+    decoded = [path(body) for body in bodies[:100]]
+    started = time.perf_counter()
+    for body in bodies:
+        path(body)
+    elapsed = time.perf_counter() - started
+    print(f'{name:<10} {len(bodies) / elapsed:12,.0f} messages/s {elapsed / len(bodies) * 1e6:8.2f} us/message')
+    return decoded
+
+
+def main() -> None:
+    bodies = [
+        events.TicketsSold(event_id=i, tickets_count=i % 5 + 1).model_dump_json().encode() for i in range(MESSAGES)
+    ]
+
+    print(f'{MESSAGES} TicketsSold messages')
+    expected = measure('legacy', legacy_path, bodies)
+    actual = measure('registry', registry_path, bodies)
+    assert actual == expected, 'Decoded events differ'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from events import views
+from events.adapters.inventory import available_tickets
+from events.domain.model import Event
+from events.service_layer.unit_of_work import SqlAlchemyUnitOfWork
+
+ROWS = int(os.getenv('BENCH_ROWS', '1000'))
+ROUNDS = int(os.getenv('BENCH_ROUNDS', '20'))
+DATABASE_URL = os.getenv('BENCH_DATABASE_URL', 'sqlite+aiosqlite://')
+
+
+async def entity_path(uow: SqlAlchemyUnitOfWork) -> list[Event]:
+    async with uow:
+        query = select(Event, available_tickets()).order_by(Event.event_datetime, Event.id).limit(ROWS)  # type: ignore
+        result = await uow.session.execute(query)
+        return [event.model_copy(update={'available_tickets': tickets}) for event, tickets in result.all()]
+
+
+async def projection_path(uow: SqlAlchemyUnitOfWork) -> list[Event]:
+    return await views.events(uow, datetime_from=None, datetime_to=None, items_count=ROWS)
+
+
+async def measure(name: str, path, uow: SqlAlchemyUnitOfWork) -> None:
+    await path(uow)
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        events = await path(uow)
+        [event.model_dump_json() for event in events]
+    elapsed = time.perf_counter() - started
+    print(f'{name:<12} {elapsed / ROUNDS * 1000:8.2f} ms/page {elapsed / ROUNDS / len(events) * 1e6:8.2f} us/row')
+
+
+async def main() -> None:
+    engine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all(
+            Event(
+                name=f'Event {i}',
+                description='Benchmark event',
+                event_datetime=datetime.now() + timedelta(days=1, minutes=i),
+                available_tickets=100,
+                ticket_price=1500.5,
+            )
+            for i in range(ROWS)
+        )
+        await session.commit()
+
+    uow = SqlAlchemyUnitOfWork(session_factory)
+    print(f'{ROWS} rows, {ROUNDS} rounds, {engine.dialect.name}', file=sys.stderr)
+    await measure('entity', entity_path, uow)
+    await measure('projection', projection_path, uow)
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+import os
+import time
+from decimal import Decimal
+
+from events.adapters.serialization import JSON, MSGPACK, registry
+from events.domain import events
+
+MESSAGES = int(os.getenv('BENCH_MESSAGES', '100000'))
+
+
+def measure(content_type: str, batch: list[events.Event]) -> list[events.Event | None]:
+    bodies = [registry.encode(event, content_type) for event in batch]
+
+    started = time.perf_counter()
+    for event in batch:
+        registry.encode(event, content_type)
+    encode_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    decoded = [registry.decode(body, content_type) for body in bodies]
+    decode_elapsed = time.perf_counter() - started
+
+    print(
+        f'{content_type:<20} {sum(map(len, bodies)) / len(bodies):6.1f} bytes/message '
+        f'{len(batch) / encode_elapsed:12,.0f} encoded/s {len(batch) / decode_elapsed:12,.0f} decoded/s'
+    )
+    return decoded
+
+
+def main() -> None:
+    batch: list[events.Event] = [
+        events.TicketsSold(event_id=i, tickets_count=i % 5 + 1)
+        if i % 4
+        else events.TicketPriceChanged(event_id=i, new_price=Decimal('1500.50'))
+        for i in range(MESSAGES)
+    ]
+
+    print(f'{MESSAGES} messages, 3 of 4 TicketsSold')
+    expected = measure(JSON, batch)
+    actual = measure(MSGPACK, batch)
+    assert actual == expected == batch, 'Decoded events differ'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any, Protocol
+
+
+class AbstractCache(Protocol):
+    hits: int
+    misses: int
+
+    def get(self, key: Hashable) -> Any | None: ...
+    def set(self, key: Hashable, value: Any) -> None: ...
+    def delete(self, key: Hashable) -> None: ...
+    def clear(self) -> None: ...
+    def __len__(self) -> int: ...
+
+
+class NullCache:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        pass
+
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,18 +1,59 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Self
+from uuid import uuid4
 
 import aio_pika
-from aio_pika.abc import AbstractChannel, AbstractConnection
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
 
+from events.adapters.serialization import CONTENT_TYPES, JSON, registry
 from events.domain import events
+from events.settings import (
+    RABBITMQ_CHANNEL_POOL_SIZE,
+    RABBITMQ_CONFIRM_TIMEOUT,
+    RABBITMQ_CONFIRM_WINDOW,
+    RABBITMQ_CONTENT_TYPE,
+    RABBITMQ_PUBLISHER_CONFIRMS,
+)
+
+
+class PublishError(Exception):
+    def __init__(self, failed: dict[int, BaseException]) -> None:
+        self.failed = failed
+        super().__init__(f'{len(failed)} events were not confirmed by the broker')
 
 
 class AbstractEventPublisher(ABC):
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
     @abstractmethod
     async def send_event(self, event: events.Event) -> None:
         raise NotImplementedError
 
+    async def send_events(self, batch: Sequence[events.Event]) -> None:
+        for event in batch:
+            await self.send_event(event)
+
 
 class FakeEventPublisher(AbstractEventPublisher):
     def __init__(self):
@@ -23,21 +64,119 @@ class FakeEventPublisher(AbstractEventPublisher):
 
 
 class RabbitMQEventPublisher(AbstractEventPublisher):
-    def __init__(self, rmq_url: str, queue_name: str = 'events') -> None:
+    def __init__(
+        self,
+        rmq_url: str,
+        queue_name: str = 'events',
+        channel_pool_size: int = 10,
+        content_type: str = JSON,
+        confirms: bool = True,
+        confirm_window: int = 256,
+        confirm_timeout: float | None = 10,
+    ) -> None:
+        if content_type not in CONTENT_TYPES:
+            raise ValueError(f'Unsupported content type {content_type}')
+
         self.rmq_url: str = rmq_url
         self.queue_name: str = queue_name
+        self.channel_pool_size: int = channel_pool_size
+        self.content_type: str = content_type
+        self.confirms: bool = confirms
+        self.confirm_window: int = confirm_window
+        self.confirm_timeout: float | None = confirm_timeout if confirms else None
+
+        self._connection: AbstractRobustConnection | None = None
+        self._channel_pool: Pool[AbstractChannel] | None = None
+        self._declared_queues: set[str] = set()
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed
+
+    async def open(self) -> None:
+        async with self._lock:
+            if self.is_open:
+                return
+
+            self._connection = await aio_pika.connect_robust(self.rmq_url)
+            self._channel_pool = Pool(self._open_channel, max_size=self.channel_pool_size)
+            self._declared_queues.clear()
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._channel_pool is not None:
+                await self._channel_pool.close()
+            if self._connection is not None:
+                await self._connection.close()
+
+            self._channel_pool = None
+            self._connection = None
+            self._declared_queues.clear()
+
+    async def _open_channel(self) -> AbstractChannel:
+        # A returned (unroutable) message fails its confirmation instead of only being logged
+        return await self._connection.channel(publisher_confirms=self.confirms, on_return_raises=True)  # type: ignore
+
+    async def _declare_queue(self, channel: AbstractChannel, queue_name: str) -> None:
+        if queue_name in self._declared_queues:
+            return
+
+        await channel.declare_queue(queue_name, durable=True)
+        self._declared_queues.add(queue_name)
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[AbstractChannel]:
-        connection: AbstractConnection = await aio_pika.connect_robust(self.rmq_url)
+        if not self.is_open:
+            await self.open()
+
+        async with self._channel_pool.acquire() as channel:  # type: ignore
+            if channel.is_closed:
+                await channel.reopen()
 
-        async with connection:
-            channel = await connection.channel()
-            await channel.declare_queue(self.queue_name, durable=True)
+            await self._declare_queue(channel, self.queue_name)
             yield channel
 
+    def _message(self, event: events.Event) -> aio_pika.Message:
+        message_body: bytes = registry.encode(event, self.content_type)
+        return aio_pika.Message(
+            body=message_body, content_type=self.content_type, message_id=event.message_id or uuid4().hex
+        )
+
+    async def _publish(self, channel: AbstractChannel, event: events.Event) -> None:
+        await channel.default_exchange.publish(
+            self._message(event), routing_key=self.queue_name, timeout=self.confirm_timeout
+        )
+
     async def send_event(self, event: events.Event) -> None:
-        message_body: bytes = event.model_dump_json().encode('utf8')
+        async with self.connect() as channel:
+            await self._publish(channel, event)
+
+    async def send_events(self, batch: Sequence[events.Event]) -> None:
+        failed: dict[int, BaseException] = {}
 
         async with self.connect() as channel:
-            await channel.default_exchange.publish(aio_pika.Message(body=message_body), routing_key=self.queue_name)  # type: ignore
+            # Publishes of a window are pipelined on the channel and their confirms awaited together,
+            # so a batch costs one round trip per window instead of one per event
+            for start in range(0, len(batch), self.confirm_window):
+                window = batch[start : start + self.confirm_window]
+                results = await asyncio.gather(
+                    *(self._publish(channel, event) for event in window), return_exceptions=True
+                )
+                failed.update(
+                    (start + index, result) for index, result in enumerate(results) if isinstance(result, BaseException)
+                )
+
+        if failed:
+            raise PublishError(failed)
+
+
+def create_publisher(rabbitmq_url: str) -> RabbitMQEventPublisher:
+    return RabbitMQEventPublisher(
+        rabbitmq_url,
+        channel_pool_size=RABBITMQ_CHANNEL_POOL_SIZE,
+        content_type=RABBITMQ_CONTENT_TYPE,
+        confirms=RABBITMQ_PUBLISHER_CONFIRMS,
+        confirm_window=RABBITMQ_CONFIRM_WINDOW,
+        confirm_timeout=RABBITMQ_CONFIRM_TIMEOUT,
+    )
@@ -0,0 +1,164 @@
+import random
+from typing import Protocol
+
+from sqlalchemy import ColumnElement, delete, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from events.domain.model import Event, EventInventoryShard as Shard
+
+
+def available_tickets() -> ColumnElement[int]:
+    shards_total = (
+        select(func.sum(Shard.available_tickets))
+        .where(Shard.event_id == Event.id)  # type: ignore
+        .correlate(Event)
+        .scalar_subquery()
+    )
+    return func.coalesce(shards_total, Event.available_tickets)
+
+
+def split(total: int, shards: int) -> list[int]:
+    base, extra = divmod(total, shards)
+    return [base + (1 if shard < extra else 0) for shard in range(shards)]
+
+
+class AbstractInventory(Protocol):
+    async def decrement(self, event_id: int, tickets_count: int) -> int | None: ...
+    async def exists(self, event_id: int) -> bool: ...
+    async def available(self, event_id: int) -> int | None: ...
+    async def set_available(self, event_id: int, total: int) -> None: ...
+    async def shard(self, event_id: int, shards: int) -> None: ...
+
+
+class SqlAlchemyInventory:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def decrement(self, event_id: int, tickets_count: int) -> int | None:
+        is_sharded = exists().where(Shard.event_id == event_id)  # type: ignore
+        stmt = (
+            update(Event)
+            .where(
+                Event.id == event_id,  # type: ignore
+                Event.available_tickets >= tickets_count,  # type: ignore
+                Event.deleted_at.is_(None),  # type: ignore
+                ~is_sharded,
+            )
+            .values(available_tickets=Event.available_tickets - tickets_count)
+            .returning(Event.available_tickets)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        remaining_tickets = result.scalar_one_or_none()
+
+        if remaining_tickets is None and await self.session.scalar(select(is_sharded)):
+            return await self._decrement_sharded(event_id, tickets_count)
+
+        return remaining_tickets
+
+    async def exists(self, event_id: int) -> bool:
+        stmt = select(exists().where(Event.id == event_id, Event.deleted_at.is_(None)))  # type: ignore
+        return bool(await self.session.scalar(stmt))
+
+    async def available(self, event_id: int) -> int | None:
+        return await self.session.scalar(select(available_tickets()).where(Event.id == event_id))  # type: ignore
+
+    async def set_available(self, event_id: int, total: int) -> None:
+        shards = await self._lock_shards(event_id)
+        if shards:
+            await self._redistribute(event_id, [shard for shard, _ in shards], total)
+
+    async def shard(self, event_id: int, shards: int) -> None:
+        total = await self.available(event_id)
+        if total is None:
+            return
+
+        await self.session.execute(delete(Shard).where(Shard.event_id == event_id))  # type: ignore
+
+        if shards > 1:
+            await self.session.execute(
+                insert(Shard),
+                [
+                    {'event_id': event_id, 'shard': shard, 'available_tickets': tickets}
+                    for shard, tickets in enumerate(split(total, shards))
+                ],
+            )
+
+        # Sales and rebalances only touch shard rows, so the event row is locked before its shards and never after.
+        # Its column is an upper bound of the shard sum from here on; readers go through available_tickets()
+        await self._set_event_total(event_id, total)
+
+    async def _decrement_sharded(self, event_id: int, tickets_count: int) -> int | None:
+        candidates = await self.session.execute(
+            select(Shard.shard)  # type: ignore
+            .join(Event, Event.id == Shard.event_id)  # type: ignore
+            .where(
+                Shard.event_id == event_id,  # type: ignore
+                Shard.available_tickets >= tickets_count,  # type: ignore
+                Event.deleted_at.is_(None),  # type: ignore
+            )
+        )
+        shard_numbers = list(candidates.scalars())
+        random.shuffle(shard_numbers)
+
+        for shard_number in shard_numbers:
+            result = await self.session.execute(
+                update(Shard)
+                .where(
+                    Shard.event_id == event_id,  # type: ignore
+                    Shard.shard == shard_number,  # type: ignore
+                    Shard.available_tickets >= tickets_count,  # type: ignore
+                )
+                .values(available_tickets=Shard.available_tickets - tickets_count)
+                .returning(Shard.available_tickets)
+                .execution_options(synchronize_session=False)
+            )
+            shard_remaining_tickets = result.scalar_one_or_none()
+
+            if shard_remaining_tickets is None:
+                continue
+            if shard_remaining_tickets == 0:
+                return await self._rebalance(event_id, skip_locked=True)
+            return await self.available(event_id)
+
+        if not await self.exists(event_id):
+            return None
+
+        # No single shard can cover the sale, so pool every shard under lock and take from the total
+        return await self._rebalance(event_id, tickets_count=tickets_count)
+
+    async def _lock_shards(self, event_id: int, skip_locked: bool = False) -> list[tuple[int, int]]:
+        result = await self.session.execute(
+            select(Shard.shard, Shard.available_tickets)  # type: ignore
+            .where(Shard.event_id == event_id)  # type: ignore
+            .order_by(Shard.shard)  # type: ignore
+            .with_for_update(skip_locked=skip_locked)
+        )
+        return [(shard, tickets) for shard, tickets in result.all()]
+
+    async def _rebalance(self, event_id: int, tickets_count: int = 0, skip_locked: bool = False) -> int | None:
+        shards = await self._lock_shards(event_id, skip_locked=skip_locked)
+        locked_total = sum(tickets for _, tickets in shards)
+
+        if locked_total < tickets_count:
+            return None
+
+        await self._redistribute(event_id, [shard for shard, _ in shards], locked_total - tickets_count)
+        return await self.available(event_id)
+
+    async def _redistribute(self, event_id: int, shard_numbers: list[int], total: int) -> None:
+        for shard_number, tickets in zip(shard_numbers, split(total, len(shard_numbers))):
+            await self.session.execute(
+                update(Shard)
+                .where(Shard.event_id == event_id, Shard.shard == shard_number)  # type: ignore
+                .values(available_tickets=tickets)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def _set_event_total(self, event_id: int, total: int) -> None:
+        await self.session.execute(
+            update(Event)
+            .where(Event.id == event_id)  # type: ignore
+            .values(available_tickets=total)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,53 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Protocol
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Field, SQLModel
+
+
+class ProcessedMessage(SQLModel, table=True):
+    __tablename__ = 'processed_message'  # type: ignore
+
+    id: str = Field(primary_key=True, description='AMQP message id')
+    processed_at: datetime = Field(
+        default_factory=datetime.now, index=True, description='Datetime when the message was processed'
+    )
+
+
+class AbstractLedger(Protocol):
+    async def record(self, message_ids: Iterable[str]) -> set[str]: ...
+    async def expire(self, before: datetime, limit: int) -> int: ...
+
+
+class SqlAlchemyLedger:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def record(self, message_ids: Iterable[str]) -> set[str]:
+        rows = [{'id': message_id, 'processed_at': datetime.now()} for message_id in dict.fromkeys(message_ids)]
+        if not rows:
+            return set()
+
+        # The primary key is the duplicate check: ids already in the ledger are simply not returned
+        dialect = postgresql if self.session.bind.dialect.name == 'postgresql' else sqlite
+        stmt = (
+            dialect.insert(ProcessedMessage)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['id'])
+            .returning(ProcessedMessage.id)
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars())
+
+    async def expire(self, before: datetime, limit: int) -> int:
+        expired = (
+            select(ProcessedMessage.id)  # type: ignore
+            .where(ProcessedMessage.processed_at < before)  # type: ignore
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(delete(ProcessedMessage).where(ProcessedMessage.id.in_(expired)))  # type: ignore
+        return result.rowcount
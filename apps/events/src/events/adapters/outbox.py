@@ -0,0 +1,68 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Protocol
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Field, SQLModel
+
+from events.domain import events
+
+
+class OutboxMessage(SQLModel, table=True):
+    __tablename__ = 'outbox'  # type: ignore
+
+    id: int = Field(default=None, primary_key=True, sa_column_kwargs={'autoincrement': True})
+    name: str = Field(description='Event name')
+    payload: str = Field(description='Event serialized to json')
+    created_at: datetime = Field(default_factory=datetime.now, description='Datetime when the event was recorded')
+
+    @classmethod
+    def from_event(cls, event: events.Event) -> 'OutboxMessage':
+        return cls(name=event.name, payload=event.model_dump_json())
+
+    def to_event(self) -> events.Event:
+        event_class = getattr(events, self.name)
+        # Derived from the row so a redelivery after a failed relay batch carries the id the consumer ledger has seen
+        return event_class.model_validate_json(self.payload).model_copy(
+            update={'message_id': f'events-outbox-{self.id}'}
+        )
+
+
+class AbstractOutbox(Protocol):
+    def add(self, event: events.Event) -> None: ...
+    def add_all(self, events: Iterable[events.Event]) -> None: ...
+    async def claim(self) -> bool: ...
+    async def pending(self, limit: int) -> Sequence[OutboxMessage]: ...
+    async def remove(self, messages: Sequence[OutboxMessage]) -> None: ...
+
+
+class SqlAlchemyOutbox:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def add(self, event: events.Event) -> None:
+        self.session.add(OutboxMessage.from_event(event))
+
+    def add_all(self, events: Iterable[events.Event]) -> None:
+        self.session.add_all([OutboxMessage.from_event(event) for event in events])
+
+    async def claim(self) -> bool:
+        # One relay publishes at a time so events leave in outbox order; the lock is released with the transaction
+        if self.session.bind.dialect.name != 'postgresql':
+            return True
+        return bool(await self.session.scalar(select(func.pg_try_advisory_xact_lock(func.hashtext('outbox')))))
+
+    async def pending(self, limit: int) -> Sequence[OutboxMessage]:
+        stmt = (
+            select(OutboxMessage)
+            .order_by(OutboxMessage.id)  # type: ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def remove(self, messages: Sequence[OutboxMessage]) -> None:
+        ids = [message.id for message in messages]
+        await self.session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(ids)))  # type: ignore
@@ -0,0 +1,66 @@
+from operator import attrgetter
+from typing import Annotated, Any, Union
+
+import msgpack
+from pydantic import Field, TypeAdapter, ValidationError
+
+from events.domain import events
+from events.logger import logger
+
+JSON = 'application/json'
+MSGPACK = 'application/msgpack'
+CONTENT_TYPES = (JSON, MSGPACK)
+
+EVENT_TYPES: tuple[type[events.Event], ...] = (
+    events.TicketPriceChanged,
+    events.AvailableTicketsDecreased,
+    events.TicketsSold,
+    events.Deleted,
+)
+
+
+class MessageRegistry:
+    def __init__(self, event_types: tuple[type[events.Event], ...] = EVENT_TYPES):
+        self.event_types = {event_type.__name__: event_type for event_type in event_types}
+        # Built once: the discriminator picks the model from `name` while parsing bytes, with no dict round trip
+        self._adapter: TypeAdapter[events.Event] = TypeAdapter(
+            Annotated[Union[event_types], Field(discriminator='name')]  # type: ignore
+        )
+        # msgpack bodies are positional arrays: the name, then the payload fields in model order
+        self._keys = {
+            name: ('name', *(field for field in event_type.model_fields if field not in ('name', 'message_id')))
+            for name, event_type in self.event_types.items()
+        }
+        self._getters = {name: attrgetter(*keys) for name, keys in self._keys.items()}
+
+    def encode(self, event: events.Event, content_type: str = JSON) -> bytes:
+        if content_type == MSGPACK:
+            # Prices carry two decimal places, which a double round-trips exactly; validation re-checks them on decode
+            return msgpack.packb(self._getters[event.name](event), default=float)
+        if content_type == JSON:
+            return event.model_dump_json().encode('utf8')
+        raise ValueError(f'Unsupported content type {content_type}')
+
+    def decode(self, body: bytes, content_type: str | None = None) -> events.Event | None:
+        try:
+            # Messages without a content type predate the negotiation and are always JSON
+            if content_type is None or content_type == JSON:
+                return self._adapter.validate_json(body)
+            if content_type == MSGPACK:
+                return self._adapter.validate_python(self._unpack(msgpack.unpackb(body)))
+            raise ValueError(f'Unsupported content type {content_type}')
+        except ValidationError as error:
+            [first, *_] = error.errors(include_url=False)
+            if error.error_count() == 1 and first['type'] == 'union_tag_invalid':
+                logger.error('Unknown event type: {}', first['ctx']['tag'])
+                return None
+            raise
+
+    def _unpack(self, values: Any) -> Any:
+        if not isinstance(values, list) or not values:
+            return values
+        # Trailing fields a newer producer appends are dropped; an unknown name is left for the tag check to report
+        return dict(zip(self._keys.get(values[0], ('name',)), values))
+
+
+registry = MessageRegistry()
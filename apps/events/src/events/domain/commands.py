@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, Field, condecimal, field_validator, model_validator
 
+from events.domain.events import TicketsSold
+
 
 class Command(BaseModel):
     model_config = {'frozen': True}
@@ -22,6 +25,12 @@ class CreateEvent(Command):
         return value
 
 
+class CreateEvents(Command):
+    events: list[dict[str, Any]] = Field(
+        description='Events to create, each validated as CreateEvent', min_length=1, max_length=1000
+    )
+
+
 class UpdateEventFields(BaseModel):
     name: str | None = Field(default=None, description='Event name')
     description: str | None = Field(default=None, description='Event description')
@@ -55,3 +64,35 @@ class UpdateEvent(Command, UpdateEventFields):
 class DeleteEvent(Command):
     id: int = Field(description='Event id')
     deleted_at: datetime = Field(default_factory=datetime.now, description='datetime when the event was deleted')
+
+
+class UpdateEvents(Command):
+    events: list[UpdateEvent] = Field(description='Events to update', min_length=1, max_length=1000)
+
+    @field_validator('events')
+    @classmethod
+    def validate_unique_ids(cls, value: list[UpdateEvent]) -> list[UpdateEvent]:
+        if len({event.id for event in value}) != len(value):
+            raise ValueError('Each event can be updated only once per batch')
+        return value
+
+
+class DeleteEvents(Command):
+    ids: list[int] = Field(description='Event ids', min_length=1, max_length=1000)
+    deleted_at: datetime = Field(default_factory=datetime.now, description='datetime when the events were deleted')
+
+    @field_validator('ids')
+    @classmethod
+    def validate_unique_ids(cls, value: list[int]) -> list[int]:
+        if len(set(value)) != len(value):
+            raise ValueError('Each event can be deleted only once per batch')
+        return value
+
+
+class SellTickets(Command):
+    sales: list[TicketsSold] = Field(description='Tickets sold events applied in one transaction')
+
+
+class ShardInventory(Command):
+    id: int = Field(description='Event id')
+    shards: int = Field(description='Number of inventory shards, 1 keeps tickets on the event row', ge=1, le=64)
@@ -0,0 +1,13 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class BulkItemError(BaseModel):
+    index: int = Field(description='Position of the item in the request')
+    errors: list[dict[str, Any]] = Field(description='Validation errors of the item')
+
+
+class BulkResult(BaseModel):
+    ids: list[int | None] = Field(description='Event ids in request order, null for rejected items')
+    errors: list[BulkItemError] = Field(default_factory=list, description='Per-item errors')
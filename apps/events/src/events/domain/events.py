@@ -1,31 +1,32 @@
-from pydantic import BaseModel, Field, condecimal, model_validator
+from typing import Literal
+
+from pydantic import BaseModel, Field, condecimal
 
 
 class Event(BaseModel):
     model_config = {'frozen': True}
     name: str
-
-    @model_validator(mode='before')
-    def set_name(cls, data: dict) -> dict:
-        if isinstance(data, dict):
-            data['name'] = cls.__name__  # type: ignore
-        return data
+    message_id: str | None = Field(default=None, exclude=True)
 
 
 class TicketPriceChanged(Event):
+    name: Literal['TicketPriceChanged'] = 'TicketPriceChanged'
     event_id: int
     new_price: condecimal(decimal_places=2) = Field(gt=0)  # type: ignore
 
 
 class AvailableTicketsDecreased(Event):
+    name: Literal['AvailableTicketsDecreased'] = 'AvailableTicketsDecreased'
     event_id: int
     remaining_tickets: int = Field(ge=0)
 
 
 class TicketsSold(Event):
+    name: Literal['TicketsSold'] = 'TicketsSold'
     event_id: int
     tickets_count: int
 
 
 class Deleted(Event):
+    name: Literal['Deleted'] = 'Deleted'
     event_id: int
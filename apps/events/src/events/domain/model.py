@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from pydantic import condecimal, field_serializer, field_validator
-from sqlmodel import CheckConstraint, Field, Index, SQLModel
+from sqlmodel import CheckConstraint, Field, Index, SQLModel, text
 
 
 class EventBase(SQLModel):
@@ -36,5 +36,23 @@ class Event(EventBase, table=True):
     __table_args__ = (
         CheckConstraint('available_tickets >= 0', name='check_available_tickets_non_negative'),
         CheckConstraint('ticket_price > 0', name='check_ticket_price_positive'),
-        Index('idx_event_datetime', 'event_datetime', postgresql_using='btree'),
+        Index('idx_event_datetime', 'event_datetime', 'id', postgresql_using='btree'),
+        Index(
+            'idx_event_listing',
+            'event_datetime',
+            'id',
+            postgresql_using='btree',
+            postgresql_where=text('available_tickets > 0 AND deleted_at IS NULL'),
+            postgresql_include=['name', 'available_tickets', 'ticket_price'],
+        ),
     )
+
+
+class EventInventoryShard(SQLModel, table=True):
+    __tablename__ = 'event_inventory_shard'  # type: ignore
+
+    event_id: int = Field(foreign_key='event.id', primary_key=True, ondelete='CASCADE')
+    shard: int = Field(primary_key=True, description='Shard number')
+    available_tickets: int = Field(description='Number of available tickets in the shard', ge=0)
+
+    __table_args__ = (CheckConstraint('available_tickets >= 0', name='check_shard_available_tickets_non_negative'),)
@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+
+from aio_pika import DeliveryMode, Message, connect
+from aio_pika.abc import AbstractIncomingMessage
+
+from events.entrypoints.eventconsumer import dead_letter_queue_name
+from events.settings import RABBITMQ_URL
+
+RETRY_HEADERS = ('x-attempt', 'x-last-error')
+
+
+def header(message: AbstractIncomingMessage, key: str) -> str:
+    value = message.headers.get(key)
+    return value.decode() if isinstance(value, bytes | bytearray) else str(value)
+
+
+def describe(message: AbstractIncomingMessage) -> str:
+    return (
+        f'{message.message_id}\tattempts={header(message, "x-attempt")}\t'
+        f'error={header(message, "x-last-error")}\tbody={message.body!r}'
+    )
+
+
+async def list_messages(rabbitmq_url: str, queue_name: str, limit: int) -> int:
+    connection = await connect(rabbitmq_url)
+    async with connection:
+        channel = await connection.channel()
+        queue = await channel.declare_queue(dead_letter_queue_name(queue_name), durable=True)
+
+        # Messages stay unacked while listing so each is fetched once, then all go back to the queue
+        messages: list[AbstractIncomingMessage] = []
+        while len(messages) < limit and (message := await queue.get(no_ack=False, fail=False)):
+            messages.append(message)
+            print(describe(message))
+
+        for message in messages:
+            await message.nack(requeue=True)
+
+        return len(messages)
+
+
+async def replay_messages(rabbitmq_url: str, queue_name: str, limit: int) -> int:
+    connection = await connect(rabbitmq_url)
+    async with connection:
+        channel = await connection.channel()
+        queue = await channel.declare_queue(dead_letter_queue_name(queue_name), durable=True)
+
+        replayed = 0
+        while replayed < limit and (message := await queue.get(no_ack=False, fail=False)):
+            headers = {name: value for name, value in message.headers.items() if name not in RETRY_HEADERS}
+            await channel.default_exchange.publish(
+                Message(
+                    body=message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    message_id=message.message_id,
+                    delivery_mode=DeliveryMode.PERSISTENT,
+                ),
+                routing_key=queue_name,
+            )
+            await message.ack()
+            replayed += 1
+            print(f'replayed {describe(message)}')
+
+        return replayed
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Inspect and replay dead-lettered consumer messages.')
+    parser.add_argument('command', choices=['list', 'replay'])
+    parser.add_argument('--queue', default='orders', help='consumer queue whose dead letters to use')
+    parser.add_argument('--limit', type=int, default=100, help='maximum number of messages')
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    if args.command == 'list':
+        count = await list_messages(RABBITMQ_URL, args.queue, args.limit)
+        print(f'{count} dead-lettered messages listed')
+    else:
+        count = await replay_messages(RABBITMQ_URL, args.queue, args.limit)
+        print(f'{count} messages replayed to {args.queue}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
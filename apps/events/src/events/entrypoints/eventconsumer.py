@@ -1,17 +1,63 @@
+import argparse
 import asyncio
-import json
+import multiprocessing
+import multiprocessing.connection
+import signal
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
-from aio_pika import connect_robust
-from aio_pika.abc import AbstractIncomingMessage
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from aio_pika import DeliveryMode, Message, connect_robust
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
-from events.adapters.eventpublisher import RabbitMQEventPublisher
-from events.domain import events
+from events import metrics
+from events.adapters.cache import AbstractCache, NullCache, TTLCache
+from events.adapters.database import create_engine
+from events.adapters.serialization import registry
+from events.domain import commands, events
+from events.entrypoints.healthprobe import HealthProbe
 from events.logger import logger
+from events.service_layer.handlers import InsufficientTickets, InvalidId
 from events.service_layer.messagebus import MessageBus
-from events.service_layer.unit_of_work import SqlAlchemyUnitOfWork
-from events.settings import POSTGRES_URL, RABBITMQ_URL
+from events.service_layer.unit_of_work import AbstractUnitOfWork, SqlAlchemyUnitOfWork, create_uow
+from events.settings import (
+    CONSUMER_BATCH_SIZE,
+    CONSUMER_BATCH_TIMEOUT_MS,
+    CONSUMER_CONCURRENCY,
+    CONSUMER_DEDUP_SIZE,
+    CONSUMER_DEDUP_TTL,
+    CONSUMER_DISPATCH_MODE,
+    CONSUMER_DRAIN_TIMEOUT,
+    CONSUMER_HEALTH_PORT,
+    CONSUMER_LANES,
+    CONSUMER_MAX_ATTEMPTS,
+    CONSUMER_PREFETCH_COUNT,
+    CONSUMER_RETRY_DELAY_MS,
+    CONSUMER_WORKERS,
+    LEDGER_EXPIRY_BATCH_SIZE,
+    LEDGER_EXPIRY_INTERVAL,
+    LEDGER_RETENTION,
+    POSTGRES_URL,
+    RABBITMQ_URL,
+)
+
+
+# Domain rejections fail the same way on every attempt, so retrying them only delays the dead letter
+NON_RETRYABLE_ERRORS = (InvalidId, InsufficientTickets)
+
+
+def retry_queue_name(queue_name: str, delay_ms: int) -> str:
+    return f'{queue_name}.retry.{delay_ms}ms'
+
+
+def dead_letter_queue_name(queue_name: str) -> str:
+    return f'{queue_name}.dlq'
 
 
 class AbstractEventConsumer(ABC):
@@ -24,68 +70,409 @@ class AbstractEventConsumer(ABC):
         raise NotImplementedError
 
 
+class PartitionedLanes:
+    def __init__(self, lanes: int, name: str = 'consumer'):
+        self.name = name
+        self.queues: list[asyncio.Queue[Callable[[], Awaitable[None]]]] = [asyncio.Queue() for _ in range(lanes)]
+        self._workers: list[asyncio.Task] = []
+
+    def lane_for(self, key: Hashable) -> int:
+        return (key if isinstance(key, int) else hash(key)) % len(self.queues)
+
+    def submit(self, key: Hashable, job: Callable[[], Awaitable[None]]) -> None:
+        self.queues[self.lane_for(key)].put_nowait(job)
+
+    def depths(self) -> list[int]:
+        return [queue.qsize() for queue in self.queues]
+
+    def start(self) -> None:
+        for lane, queue in enumerate(self.queues):
+            self._workers.append(asyncio.create_task(self._work(lane, queue)))
+            metrics.gauge(f'{self.name}_lane_{lane}_depth', queue.qsize)
+
+    async def join(self) -> None:
+        await asyncio.gather(*(queue.join() for queue in self.queues))
+
+    async def stop(self) -> None:
+        for lane, worker in enumerate(self._workers):
+            worker.cancel()
+            metrics.remove_gauge(f'{self.name}_lane_{lane}_depth')
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def _work(self, lane: int, queue: asyncio.Queue[Callable[[], Awaitable[None]]]) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await job()
+            except Exception as error:
+                logger.error('Lane {} failed to process message. {!r}', lane, error)
+            finally:
+                queue.task_done()
+
+
+class MicroBatcher[T]:
+    def __init__(self, flush: Callable[[list[T]], Coroutine[Any, Any, None]], max_size: int, max_delay: float):
+        self.flush = flush
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._items: list[T] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def add(self, item: T) -> None:
+        self._items.append(item)
+
+        if len(self._items) >= self.max_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._items:
+            return
+
+        items, self._items = self._items, []
+        task: asyncio.Task[None] = asyncio.create_task(self.flush(items))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def stop(self) -> None:
+        self._flush_pending()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+
 class RabbitMQEventConsumer(AbstractEventConsumer):
-    def __init__(self, bus: MessageBus, rabbitmq_url: str, queue_name: str = 'orders'):
-        self.bus = bus
+    def __init__(
+        self,
+        bus_factory: Callable[[], MessageBus],
+        rabbitmq_url: str,
+        queue_name: str = 'orders',
+        prefetch_count: int = CONSUMER_PREFETCH_COUNT,
+        concurrency: int = CONSUMER_CONCURRENCY,
+        dispatch_mode: str = CONSUMER_DISPATCH_MODE,
+        lanes: int = CONSUMER_LANES,
+        batch_size: int = CONSUMER_BATCH_SIZE,
+        batch_timeout_ms: int = CONSUMER_BATCH_TIMEOUT_MS,
+        drain_timeout: float = CONSUMER_DRAIN_TIMEOUT,
+        dedup_size: int = CONSUMER_DEDUP_SIZE,
+        dedup_ttl: float = CONSUMER_DEDUP_TTL,
+        max_attempts: int = CONSUMER_MAX_ATTEMPTS,
+        retry_delay_ms: int = CONSUMER_RETRY_DELAY_MS,
+    ):
+        self.bus_factory = bus_factory
         self.rabbitmq_url = rabbitmq_url
         self.queue_name = queue_name
+        self.prefetch_count = prefetch_count
+        self.concurrency = concurrency
+        self.dispatch_mode = dispatch_mode
+        self.drain_timeout = drain_timeout
+        self.max_attempts = max_attempts
+        self.retry_delays = [retry_delay_ms * 2**attempt for attempt in range(max_attempts - 1)]
+        self.dead_letter_queue = dead_letter_queue_name(queue_name)
+        self.consuming = False
+        self._channel: AbstractChannel | None = None
+        self._stopping = asyncio.Event()
+        self._inflight: set[asyncio.Task] = set()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # Only ever proves a message was seen; the ledger in the handler transaction is the source of truth
+        self.recent: AbstractCache = TTLCache(dedup_size, dedup_ttl) if dedup_size else NullCache()
+        self.lanes = PartitionedLanes(lanes) if dispatch_mode == 'partitioned' else None
+        self.batcher: MicroBatcher[tuple[AbstractIncomingMessage, events.Event | None]] | None = None
+
+        if dispatch_mode == 'batched':
+            self.batcher = MicroBatcher(self.process_batch, max_size=batch_size, max_delay=batch_timeout_ms / 1000)
+            self.prefetch_count = max(prefetch_count, batch_size)
+
+    def decode(self, message: AbstractIncomingMessage) -> events.Event | None:
+        event = registry.decode(message.body, message.content_type)
+        if event is not None and message.message_id is not None:
+            event = event.model_copy(update={'message_id': message.message_id})
+        return event
+
+    async def decode_or_dead_letter(self, message: AbstractIncomingMessage) -> events.Event | None:
+        try:
+            return self.decode(message)
+        except Exception as error:
+            # A message that cannot be decoded will never succeed, so it skips the retry queues
+            await self.reroute(message, error, retry=False)
+            raise
+
+    async def reroute(self, message: AbstractIncomingMessage, error: Exception, retry: bool = True) -> None:
+        attempt = int(message.headers.get('x-attempt', 0)) + 1  # type: ignore
+        if retry and attempt < self.max_attempts:
+            routing_key, counter = retry_queue_name(self.queue_name, self.retry_delays[attempt - 1]), 'consumer_retries'
+        else:
+            routing_key, counter = self.dead_letter_queue, 'consumer_dead_letters'
+
+        await self._channel.default_exchange.publish(  # type: ignore
+            Message(
+                body=message.body,
+                headers={**message.headers, 'x-attempt': attempt, 'x-last-error': repr(error)[:1024]},
+                content_type=message.content_type,
+                message_id=message.message_id,
+                delivery_mode=DeliveryMode.PERSISTENT,
+            ),
+            routing_key=routing_key,
+        )
+        await message.ack()
+        metrics.inc(counter)
+        logger.warning('Message {} failed attempt {}, moved to {}', message.message_id, attempt, routing_key)
+
+    @asynccontextmanager
+    async def settle(self, message: AbstractIncomingMessage) -> AsyncGenerator[None]:
+        try:
+            yield
+        except Exception as error:
+            await self.reroute(message, error, retry=not isinstance(error, NON_RETRYABLE_ERRORS))
+            raise
+        else:
+            await message.ack()
 
-    def deserialize_event(self, event_data: dict) -> events.Event | None:
-        event_name = event_data.pop('name')
-        event_class = getattr(events, event_name, None)
+    def is_duplicate(self, message: AbstractIncomingMessage) -> bool:
+        return message.message_id is not None and self.recent.get(message.message_id) is not None
 
-        if not event_class:
-            logger.error(f'Unknown event type: {event_name}')
-            return None
+    def remember(self, message: AbstractIncomingMessage) -> None:
+        if message.message_id is not None:
+            self.recent.set(message.message_id, True)
 
-        return event_class(**event_data)  # type: ignore
+    async def handle(self, event: events.Event | None) -> None:
+        await self.bus_factory().handle(event) if event else None
+
+    async def process(self, message: AbstractIncomingMessage, event: events.Event | None) -> None:
+        async with self.settle(message):
+            await self.handle(event)
+            self.remember(message)
+
+    async def process_batch(self, batch: list[tuple[AbstractIncomingMessage, events.Event | None]]) -> None:
+        sales = [(message, event) for message, event in batch if isinstance(event, events.TicketsSold)]
+        others = [(message, event) for message, event in batch if not isinstance(event, events.TicketsSold)]
+
+        async with self._semaphore:
+            if sales:
+                try:
+                    await self.bus_factory().handle(commands.SellTickets(sales=[event for _, event in sales]))
+                except Exception as error:
+                    logger.warning('Batch of {} messages failed, retrying one by one. {!r}', len(sales), error)
+                    metrics.inc('consumer_batch_fallbacks')
+                    others = sales + others
+                else:
+                    for message, _ in sales:
+                        self.remember(message)
+                        await message.ack()
+                    metrics.inc('consumer_batches')
+
+            for message, event in others:
+                with suppress(Exception):
+                    await self.process(message, event)
 
     async def on_message(self, message: AbstractIncomingMessage) -> None:
-        logger.info(f'Received message: {message.info()}. Body is {message.body!r}')
+        task = asyncio.current_task()
+        self._inflight.add(task)  # type: ignore
+        try:
+            await self.dispatch(message)
+        finally:
+            self._inflight.discard(task)  # type: ignore
+
+    async def dispatch(self, message: AbstractIncomingMessage) -> None:
+        logger.opt(lazy=True).debug('Received message: {}. Body is {!r}', message.info, lambda: message.body)
+
+        if self.is_duplicate(message):
+            logger.debug('Skipping duplicate message {}', message.message_id)
+            metrics.inc('consumer_duplicates')
+            await message.ack()
+            return
+
+        if self.lanes is None and self.batcher is None:
+            async with self._semaphore:
+                await self.process(message, await self.decode_or_dead_letter(message))
+            return
+
+        event = await self.decode_or_dead_letter(message)
 
-        body = message.body.decode()
-        event_data = json.loads(body)
-        event = self.deserialize_event(event_data)
+        if self.batcher is not None:
+            self.batcher.add((message, event))
+            return
 
-        await self.bus.handle(event) if event else None
+        # Enqueue without awaiting first so messages keep their delivery order inside a lane
+        self.lanes.submit(getattr(event, 'event_id', None), partial(self.process, message, event))  # type: ignore
 
     async def consume(self):
         connection = await connect_robust(self.rabbitmq_url)
         async with connection:
-            channel = await connection.channel()
-            queue = await channel.declare_queue('orders', durable=True)
+            channel = self._channel = await connection.channel()
+            await channel.set_qos(prefetch_count=self.prefetch_count)
+            queue = await channel.declare_queue(self.queue_name, durable=True)
+            await self.declare_retry_queues(channel)
+
+            if self.lanes is not None:
+                self.lanes.start()
+
+            try:
+                consumer_tag = await queue.consume(self.on_message, no_ack=False)
+                self.consuming = True
+                logger.info('Waiting for messages (prefetch={}, mode={})...', self.prefetch_count, self.dispatch_mode)
+                await self._stopping.wait()
+
+                logger.info('Stopping consumer, draining in-flight messages...')
+                self.consuming = False
+                await queue.cancel(consumer_tag)
+                await self.drain()
+            finally:
+                self.consuming = False
+                if self.lanes is not None:
+                    await self.lanes.stop()
+                if self.batcher is not None:
+                    await self.batcher.stop()
+
+    async def declare_retry_queues(self, channel: AbstractChannel) -> None:
+        # Expired retries are dead-lettered by the broker back to the main queue
+        for delay_ms in self.retry_delays:
+            await channel.declare_queue(
+                retry_queue_name(self.queue_name, delay_ms),
+                durable=True,
+                arguments={
+                    'x-message-ttl': delay_ms,
+                    'x-dead-letter-exchange': '',
+                    'x-dead-letter-routing-key': self.queue_name,
+                },
+            )
+        await channel.declare_queue(self.dead_letter_queue, durable=True)
+
+    async def drain(self) -> None:
+        try:
+            async with asyncio.timeout(self.drain_timeout):
+                if self._inflight:
+                    await asyncio.wait(self._inflight)
+                if self.lanes is not None:
+                    await self.lanes.join()
+                if self.batcher is not None:
+                    await self.batcher.stop()
+        except TimeoutError:
+            logger.warning('Consumer did not drain in {}s, unacked messages will be redelivered', self.drain_timeout)
+
+    def stop(self) -> None:
+        self._stopping.set()
+
 
-            await queue.consume(self.on_message, no_ack=True)
-            logger.info('Waiting for messages...')
-            await asyncio.Future()
+class LedgerExpiry:
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        retention: float = LEDGER_RETENTION,
+        batch_size: int = LEDGER_EXPIRY_BATCH_SIZE,
+        interval: float = LEDGER_EXPIRY_INTERVAL,
+    ) -> None:
+        self.uow = uow
+        self.retention = retention
+        self.batch_size = batch_size
+        self.interval = interval
 
+    async def expire_batch(self) -> int:
+        async with self.uow:
+            expired = await self.uow.ledger.expire(datetime.now() - timedelta(seconds=self.retention), self.batch_size)
+            await self.uow.commit()
+            return expired
 
-def create_engine(postgres_url: str) -> AsyncEngine:
-    return create_async_engine(str(postgres_url), echo=False, future=True)
+    async def run(self) -> None:
+        while True:
+            try:
+                expired = await self.expire_batch()
+            except Exception as error:
+                logger.exception('Exception expiring processed messages. {}', error)
+                expired = 0
 
+            if expired:
+                logger.debug('Expired {} processed messages', expired)
+            if expired < self.batch_size:
+                await asyncio.sleep(self.interval)
 
-def create_uow(engine: AsyncEngine) -> SqlAlchemyUnitOfWork:
+
+def create_bus_factory(engine: AsyncEngine) -> Callable[[], MessageBus]:
     session_factory = async_sessionmaker(engine)
-    return SqlAlchemyUnitOfWork(session_factory)
+    return lambda: MessageBus(SqlAlchemyUnitOfWork(session_factory))
+
+
+@asynccontextmanager
+async def running_consumer() -> AsyncGenerator[RabbitMQEventConsumer]:
+    engine = create_engine(POSTGRES_URL, name='consumer')
+    consumer = RabbitMQEventConsumer(create_bus_factory(engine), RABBITMQ_URL)
+
+    expiry = asyncio.create_task(LedgerExpiry(create_uow(engine)).run())
+    try:
+        yield consumer
+    finally:
+        expiry.cancel()
+        await asyncio.gather(expiry, return_exceptions=True)
+        await engine.dispose()
+        await logger.complete()
+
+
+async def main() -> None:
+    async with running_consumer() as consumer:
+        await consumer.consume()
+
+
+async def serve(health_port: int = CONSUMER_HEALTH_PORT) -> None:
+    async with running_consumer() as consumer:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, consumer.stop)
 
+        async with HealthProbe(lambda: consumer.consuming, port=health_port):
+            await consumer.consume()
 
-def create_publisher(rabbitmq_url: str) -> RabbitMQEventPublisher:
-    return RabbitMQEventPublisher(rabbitmq_url)
 
+def worker(health_port: int) -> None:
+    asyncio.run(serve(health_port))
 
-def create_messagebus(uow: SqlAlchemyUnitOfWork, publisher: RabbitMQEventPublisher) -> MessageBus:
-    return MessageBus(uow, publisher)
 
+def supervise(workers: int, health_port: int) -> int:
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=worker, args=(health_port,), name=f'consumer-{index}') for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
 
-async def main():
-    engine = create_engine(POSTGRES_URL)
-    uow = create_uow(engine)
-    publisher = create_publisher(RABBITMQ_URL)
-    bus = create_messagebus(uow, publisher)
+    def terminate(*_):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
 
-    consumer = RabbitMQEventConsumer(bus, RABBITMQ_URL)
-    await consumer.consume()
+    signal.signal(signal.SIGTERM, terminate)
+    signal.signal(signal.SIGINT, terminate)
+
+    # One worker exiting takes the others down so the orchestrator restarts the whole tier
+    multiprocessing.connection.wait([process.sentinel for process in processes])
+    terminate()
+    for process in processes:
+        process.join()
+
+    return 0 if all(process.exitcode == 0 for process in processes) else 1
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Consume order events from RabbitMQ.')
+    parser.add_argument('--workers', type=int, default=CONSUMER_WORKERS, help='number of consumer processes')
+    parser.add_argument('--health-port', type=int, default=CONSUMER_HEALTH_PORT, help='port of the health probe')
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    return args
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    args = parse_args()
+
+    if args.workers == 1:
+        worker(args.health_port)
+    else:
+        sys.exit(supervise(args.workers, args.health_port))
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from events.adapters.database import create_engine
+from events.adapters.eventpublisher import RabbitMQEventPublisher, create_publisher
+from events.settings import POSTGRES_URL, RABBITMQ_URL  # type: ignore
+
+
+@dataclass(frozen=True)
+class Container:
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    publisher: RabbitMQEventPublisher
+
+
+def create_container() -> Container:
+    engine = create_engine(POSTGRES_URL, name='api')
+    return Container(
+        engine=engine,
+        session_factory=async_sessionmaker(engine, expire_on_commit=False),
+        publisher=create_publisher(RABBITMQ_URL),
+    )
@@ -1,29 +1,47 @@
 import asyncio
+from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.concurrency import asynccontextmanager
 
-from events.entrypoints import eventconsumer
+from events.entrypoints import eventconsumer, outboxrelay
+from events.logger import logger
+from events.settings import EMBEDDED_CONSUMER
 
+from .dependencies.container import create_container
 from .dependencies.db import init_database
-from .middlewares import log_requests
-from .routers import admin, user
+from .middlewares import LogRequestsMiddleware
+from .routers import admin, export, metrics, user
 
 
 @asynccontextmanager
-async def lifespan(app):
-    async with init_database():
-        asyncio.create_task(eventconsumer.main())
-        yield
+async def lifespan(app: FastAPI) -> AsyncGenerator:
+    container = app.state.container = create_container()
+    async with init_database(container.engine), container.publisher:
+        tasks = [asyncio.create_task(outboxrelay.main(container.publisher))]
+        if EMBEDDED_CONSUMER:
+            tasks.append(asyncio.create_task(eventconsumer.main()))
+        try:
+            yield
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    # The sink is enqueued, so wait for the records still in flight before the process exits
+    await logger.complete()
 
 
 app = FastAPI(
     title='Events service.',
     description='A service to manage events and notify the order service about changes.',
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-app.middleware('http')(log_requests)
+app.add_middleware(LogRequestsMiddleware)
 
+app.include_router(export.router)
 app.include_router(user.router)
 app.include_router(admin.router)
+app.include_router(metrics.router)
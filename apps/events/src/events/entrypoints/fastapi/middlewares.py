@@ -1,34 +1,77 @@
-from collections.abc import Callable
-from datetime import datetime
+import random
+import time
 
-from fastapi import Request, Response
+from starlette.status import HTTP_400_BAD_REQUEST
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from events.logger import logger
+from events.settings import LOG_BODY_MAX_SIZE, LOG_BODY_SAMPLE_RATE
 
+REDACTED_HEADERS = {b'authorization', b'proxy-authorization', b'cookie'}
 
-async def log_requests(request: Request, call_next: Callable) -> Response:
-    start_time = datetime.now()
 
-    log_data = {
-        'method': request.method,
-        'url': str(request.url),
-        'headers': dict(request.headers),
-        'query_params': dict(request.query_params),
-        'body': await request.body(),
-        'client': request.client.host if request.client else None,
+def redact_headers(headers: list[tuple[bytes, bytes]]) -> dict[str, str]:
+    return {
+        name.decode('latin-1'): '[REDACTED]' if name.lower() in REDACTED_HEADERS else value.decode('latin-1')
+        for name, value in headers
     }
 
-    try:
-        response = await call_next(request)
-        log_data['status_code'] = response.status_code
-    except Exception as e:
-        log_data['error'] = str(e)
-        logger.error(log_data)
-        raise e
 
-    end_time = datetime.now()
-    log_data['duration_ms'] = (end_time - start_time).total_seconds() * 1000  # type: ignore
+class LogRequestsMiddleware:
+    def __init__(
+        self, app: ASGIApp, body_sample_rate: float = LOG_BODY_SAMPLE_RATE, body_max_size: int = LOG_BODY_MAX_SIZE
+    ) -> None:
+        self.app = app
+        self.body_sample_rate = body_sample_rate
+        self.body_max_size = body_max_size
 
-    logger.info(log_data)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
 
-    return response
+        start_time = time.perf_counter()
+        status_code = 500
+        body_chunks: list[bytes] = []
+        body_size = 0
+
+        async def receive_and_keep_body() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message['type'] == 'http.request' and body_size < self.body_max_size:
+                chunk = message.get('body', b'')[: self.body_max_size - body_size]
+                body_chunks.append(chunk)
+                body_size += len(chunk)
+            return message
+
+        async def send_and_keep_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        log_data = {
+            'method': scope['method'],
+            'path': scope['path'],
+            'query_string': scope['query_string'].decode('latin-1'),
+            'client': scope['client'][0] if scope.get('client') else None,
+        }
+
+        try:
+            await self.app(scope, receive_and_keep_body, send_and_keep_status)
+        except Exception as e:
+            log_data['error'] = str(e)
+            log_data['headers'] = redact_headers(scope['headers'])
+            log_data['body'] = b''.join(body_chunks)
+            log_data['duration_ms'] = (time.perf_counter() - start_time) * 1000
+            logger.error(log_data)
+            raise e
+
+        log_data['status_code'] = status_code
+        log_data['duration_ms'] = (time.perf_counter() - start_time) * 1000
+
+        if status_code >= HTTP_400_BAD_REQUEST or random.random() < self.body_sample_rate:
+            log_data['headers'] = redact_headers(scope['headers'])
+            log_data['body'] = b''.join(body_chunks)
+
+        logger.info(log_data)
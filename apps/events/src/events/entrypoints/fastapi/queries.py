@@ -1,20 +1,37 @@
+import base64
+import binascii
 from datetime import datetime
 
 from fastapi import HTTPException
 from pydantic import BaseModel, Field, model_validator
 
+MAX_ITEMS_COUNT = 100
+
 
 def truncated_now():
     return datetime.now().replace(second=0, microsecond=0)
 
 
+def encode_cursor(event_datetime: datetime, event_id: int) -> str:
+    return base64.urlsafe_b64encode(f'{event_datetime.isoformat()}|{event_id}'.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        event_datetime, event_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(event_datetime), int(event_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail='Invalid cursor')
+
+
 class EventsQuery(BaseModel):
     datetime_from: datetime = Field(
         default_factory=truncated_now, description='Start datetime filter', examples=['2025-01-01T00:00']
     )
     datetime_to: datetime | None = Field(default=None, description='End datetime filter', examples=['2025-12-31T00:00'])
     page: int = Field(default=1, ge=1, description='Page number')
-    items_count: int = Field(default=20, ge=1, description='Number of items per page')
+    items_count: int = Field(default=20, ge=1, le=MAX_ITEMS_COUNT, description='Number of items per page')
+    cursor: str | None = Field(default=None, description='Cursor from the X-Next-Cursor header of the previous page')
 
     model_config = {'extra': 'forbid'}
 
@@ -31,4 +48,7 @@ class EventsQuery(BaseModel):
         if self.datetime_from and self.datetime_to and self.datetime_from > self.datetime_to:
             raise HTTPException(status_code=400, detail='datetime_from cannot be greater than datetime_to')
 
+        if self.cursor and self.page > 1:
+            raise HTTPException(status_code=400, detail='page cannot be used together with cursor')
+
         return self
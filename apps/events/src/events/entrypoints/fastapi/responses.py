@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from events.domain.model import Event
+
+
+def format_datetime(value: datetime | None) -> str | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.isoformat(timespec='minutes')
+    return value.strftime('%Y-%m-%dT%H:%M')
+
+
+def event_to_dict(event: Event) -> dict[str, Any]:
+    return {
+        'name': event.name,
+        'description': event.description,
+        'event_datetime': format_datetime(event.event_datetime),
+        'available_tickets': event.available_tickets,
+        'ticket_price': round(float(event.ticket_price), 2),
+        'deleted_at': format_datetime(event.deleted_at),
+        'id': event.id,
+    }
+
+
+class EventResponse(ORJSONResponse):
+    def render(self, content: Event | list[Event]) -> bytes:
+        if isinstance(content, list):
+            return orjson.dumps([event_to_dict(event) for event in content])
+        return orjson.dumps(event_to_dict(content))
@@ -1,8 +1,18 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
 
-from events.domain.commands import CreateEvent, DeleteEvent, UpdateEvent, UpdateEventFields
+from events.domain.commands import (
+    CreateEvent,
+    CreateEvents,
+    DeleteEvent,
+    DeleteEvents,
+    ShardInventory,
+    UpdateEvent,
+    UpdateEventFields,
+    UpdateEvents,
+)
+from events.domain.dtos import BulkResult
 from events.domain.model import Event
 from events.service_layer.handlers import InvalidId
 from events.service_layer.messagebus import MessageBus
@@ -18,6 +28,29 @@ async def create_event(bus: Annotated[MessageBus, Depends(bus)], cmd: CreateEven
     return await bus.handle(cmd)
 
 
+@router.post('/bulk')
+async def create_events(bus: Annotated[MessageBus, Depends(bus)], cmd: CreateEvents) -> BulkResult:
+    return await bus.handle(cmd)
+
+
+@router.put('/bulk')
+async def update_events(bus: Annotated[MessageBus, Depends(bus)], cmd: UpdateEvents) -> None:
+    try:
+        await bus.handle(cmd)
+    except InvalidId as exc:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=exc.args)
+
+
+@router.delete('/bulk')
+async def delete_events(
+    bus: Annotated[MessageBus, Depends(bus)], ids: Annotated[list[int], Query(min_length=1, max_length=1000)]
+) -> None:
+    try:
+        await bus.handle(DeleteEvents(ids=list(dict.fromkeys(ids))))
+    except InvalidId as exc:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=exc.args)
+
+
 @router.delete('/{id}')
 async def delete_event(bus: Annotated[MessageBus, Depends(bus)], id: Annotated[int, Path(title='Event id')]) -> None:
     try:
@@ -34,3 +67,15 @@ async def update_event(
         return await bus.handle(UpdateEvent(id=id, **cmd.model_dump()))
     except InvalidId as exc:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail=exc.args)
+
+
+@router.put('/{id}/inventory')
+async def shard_inventory(
+    bus: Annotated[MessageBus, Depends(bus)],
+    id: Annotated[int, Path(title='Event id')],
+    shards: Annotated[int, Body(embed=True, ge=1, le=64, description='Number of inventory shards')],
+) -> None:
+    try:
+        await bus.handle(ShardInventory(id=id, shards=shards))
+    except InvalidId as exc:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=exc.args)
@@ -0,0 +1,57 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from events import views
+from events.domain.model import Event
+from events.service_layer.messagebus import MessageBus
+from events.settings import EXPORT_BATCH_SIZE
+
+from ..dependencies.bus import bus
+from ..dependencies.http import is_user
+
+router = APIRouter(tags=['Events'], prefix='/events', dependencies=[Depends(is_user)])
+
+FIELDS = ['id', 'name', 'description', 'event_datetime', 'available_tickets', 'ticket_price']
+MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+
+async def ndjson_lines(batches: AsyncIterator[list[Event]]) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield ''.join(event.model_dump_json(include=set(FIELDS)) + '\n' for event in batch)
+
+
+async def csv_lines(batches: AsyncIterator[list[Event]]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    writer.writeheader()
+
+    async for batch in batches:
+        writer.writerows(event.model_dump(mode='json', include=set(FIELDS)) for event in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get('/export')
+async def export_events(
+    bus: Annotated[MessageBus, Depends(bus)],
+    format: Annotated[Literal['ndjson', 'csv'], Query()] = 'ndjson',
+    datetime_from: Annotated[datetime | None, Query()] = None,
+) -> StreamingResponse:
+    batches = views.stream_events(bus.uow, datetime_from or datetime.now(), batch_size=EXPORT_BATCH_SIZE)
+    lines = ndjson_lines(batches) if format == 'ndjson' else csv_lines(batches)
+
+    return StreamingResponse(
+        lines,
+        media_type=MEDIA_TYPES[format],
+        headers={'Content-Disposition': f'attachment; filename="events.{format}"'},
+    )
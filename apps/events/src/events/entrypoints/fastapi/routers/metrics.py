@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+
+from events import metrics
+
+from ..dependencies.http import is_admin
+
+router = APIRouter(tags=['Metrics'], prefix='/metrics', dependencies=[Depends(is_admin)])
+
+
+@router.get('/')
+async def get_metrics() -> dict[str, float]:
+    return metrics.snapshot()
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 
 from events import views
 from events.domain.model import Event
@@ -8,32 +8,38 @@ from events.service_layer.messagebus import MessageBus
 
 from ..dependencies.bus import bus
 from ..dependencies.http import is_user
-from ..queries import EventsQuery
+from ..queries import EventsQuery, decode_cursor, encode_cursor
+from ..responses import EventResponse
 
 router = APIRouter(tags=['Events'], prefix='/events', dependencies=[Depends(is_user)])
 
 
-@router.get('/{id}')
-async def get_event(bus: Annotated[MessageBus, Depends(bus)], id: Annotated[int, Path(title='Event id')]) -> Event:
+@router.get('/{id}', response_model=Event, response_class=EventResponse)
+async def get_event(bus: Annotated[MessageBus, Depends(bus)], id: Annotated[int, Path(title='Event id')]) -> Response:
     event = await views.event(bus.uow, id)
 
     if not event:
         raise HTTPException(status.HTTP_404_NOT_FOUND)
 
-    return event
+    return EventResponse(event)
 
 
-@router.get('/')
-async def get_events(bus: Annotated[MessageBus, Depends(bus)], query: Annotated[EventsQuery, Query()]) -> list[Event]:
+@router.get('/', response_model=list[Event], response_class=EventResponse)
+async def get_events(bus: Annotated[MessageBus, Depends(bus)], query: Annotated[EventsQuery, Query()]) -> Response:
     events = await views.events(
         uow=bus.uow,
         datetime_from=query.datetime_from,
         datetime_to=query.datetime_to,
         page=query.page,
         items_count=query.items_count,
+        after=decode_cursor(query.cursor) if query.cursor else None,
     )
 
     if not events:
         raise HTTPException(status_code=404, detail='No events found')
 
-    return events
+    headers = {}
+    if len(events) == query.items_count:
+        headers['X-Next-Cursor'] = encode_cursor(events[-1].event_datetime, events[-1].id)
+
+    return EventResponse(events, headers=headers)
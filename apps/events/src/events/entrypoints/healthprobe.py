@@ -0,0 +1,55 @@
+import asyncio
+import json
+import os
+from collections.abc import Callable
+from contextlib import suppress
+
+from events import metrics
+from events.settings import CONSUMER_HEALTH_PORT
+
+
+class HealthProbe:
+    def __init__(self, check: Callable[[], bool], host: str = '0.0.0.0', port: int = CONSUMER_HEALTH_PORT):
+        self.check = check
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> 'HealthProbe':
+        # Every worker process binds the same port, so a probe is answered by any live worker
+        self._server = await asyncio.start_server(self.on_connect, self.host, self.port, reuse_port=True)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request = b''
+        with suppress(asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError):
+            async with asyncio.timeout(1):
+                request = await reader.readuntil(b'\r\n\r\n')
+
+        status, content_type, body = self.respond(request)
+        writer.write(
+            b'HTTP/1.1 %s\r\nContent-Type: %s\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s'
+            % (status, content_type, len(body), body)
+        )
+        with suppress(ConnectionError):
+            await writer.drain()
+        writer.close()
+
+    def respond(self, request: bytes) -> tuple[bytes, bytes, bytes]:
+        request_line = request.split(b'\r\n', 1)[0].split()
+        path = request_line[1] if len(request_line) > 1 else b'/'
+
+        # Counters live in each worker process, so a scrape reports the worker that accepted the connection
+        if path.rstrip(b'/') == b'/metrics':
+            body = json.dumps({'pid': os.getpid(), **metrics.snapshot()}).encode()
+            return b'200 OK', b'application/json', body
+
+        if self.check():
+            return b'200 OK', b'text/plain', b'ok'
+        return b'503 Service Unavailable', b'text/plain', b'unavailable'
@@ -0,0 +1,84 @@
+import asyncio
+
+from events.adapters.eventpublisher import AbstractEventPublisher, PublishError, create_publisher
+from events.adapters.database import create_engine
+from events.logger import logger
+from events.service_layer.unit_of_work import AbstractUnitOfWork, create_uow
+from events.settings import OUTBOX_BATCH_SIZE, OUTBOX_POLL_INTERVAL, POSTGRES_URL, RABBITMQ_URL
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        uow: AbstractUnitOfWork,
+        publish: AbstractEventPublisher,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval: float = OUTBOX_POLL_INTERVAL,
+    ) -> None:
+        self.uow = uow
+        self.publish = publish
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+    async def relay_batch(self) -> int:
+        async with self.uow:
+            if not await self.uow.outbox.claim():
+                return 0
+
+            messages = await self.uow.outbox.pending(self.batch_size)
+            if not messages:
+                return 0
+
+            confirmed = messages
+            try:
+                await self.publish.send_events([message.to_event() for message in messages])
+            except PublishError as error:
+                # Rows after the first unconfirmed one are kept too: the retry replays them in outbox order, so an
+                # older event never lands after a newer one for the same event
+                first_failed = min(error.failed)
+                confirmed = messages[:first_failed]
+                logger.warning(
+                    '{} of {} outbox messages were not confirmed, retrying from message {}. {!r}',
+                    len(error.failed),
+                    len(messages),
+                    first_failed,
+                    error.failed[first_failed],
+                )
+
+            if confirmed:
+                await self.uow.outbox.remove(confirmed)
+                await self.uow.commit()
+
+            logger.debug('Relayed {} outbox messages', len(confirmed))
+            return len(confirmed)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception as error:
+                logger.exception('Exception relaying outbox messages. {}', error)
+                relayed = 0
+
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+
+async def main(publisher: AbstractEventPublisher | None = None) -> None:
+    engine = create_engine(POSTGRES_URL, name='outbox')
+    uow = create_uow(engine)
+
+    owns_publisher = publisher is None
+    publisher = publisher or create_publisher(RABBITMQ_URL)
+
+    relay = OutboxRelay(uow, publisher)
+    try:
+        await relay.run()
+    finally:
+        if owns_publisher:
+            await publisher.close()
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
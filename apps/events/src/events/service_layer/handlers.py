@@ -1,8 +1,13 @@
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime
 
-from events.adapters.eventpublisher import AbstractEventPublisher
-from events.domain import commands, events, model
+from pydantic import ValidationError
+from sqlalchemy import insert, select, update
+
+from events import views
+from events.adapters.inventory import available_tickets
+from events.domain import commands, dtos, events, model
 from events.service_layer.unit_of_work import AbstractUnitOfWork
 
 
@@ -10,9 +15,11 @@ class InvalidId(Exception):
     pass
 
 
-async def create_event(
-    cmd: commands.CreateEvent, uow: AbstractUnitOfWork, publish: AbstractEventPublisher
-) -> model.Event:
+class InsufficientTickets(Exception):
+    pass
+
+
+async def create_event(cmd: commands.CreateEvent, uow: AbstractUnitOfWork) -> model.Event:
     async with uow:
         event = model.Event(**cmd.model_dump())
         uow.session.add(event)
@@ -20,36 +27,70 @@ async def create_event(
         return event
 
 
-async def update_event(
-    cmd: commands.UpdateEvent, uow: AbstractUnitOfWork, publish: AbstractEventPublisher
-) -> model.Event:
+async def create_events(cmd: commands.CreateEvents, uow: AbstractUnitOfWork) -> dtos.BulkResult:
+    valid: dict[int, commands.CreateEvent] = {}
+    errors: list[dtos.BulkItemError] = []
+
+    for index, item in enumerate(cmd.events):
+        try:
+            valid[index] = commands.CreateEvent.model_validate(item)
+        except ValidationError as exc:
+            item_errors = exc.errors(include_url=False, include_context=False, include_input=False)
+            errors.append(dtos.BulkItemError(index=index, errors=item_errors))  # type: ignore
+
+    ids: list[int | None] = [None] * len(cmd.events)
+
+    if valid:
+        async with uow:
+            result = await uow.session.execute(
+                insert(model.Event).returning(model.Event.id, sort_by_parameter_order=True),  # type: ignore
+                [event.model_dump() for event in valid.values()],
+            )
+            for index, event_id in zip(valid, result.scalars(), strict=True):
+                ids[index] = event_id
+            await uow.commit()
+
+    return dtos.BulkResult(ids=ids, errors=errors)
+
+
+async def update_event(cmd: commands.UpdateEvent, uow: AbstractUnitOfWork) -> model.Event:
     async with uow:
         event = await uow.session.get(model.Event, cmd.id)
         if not event:
             raise InvalidId(f'Invalid id {cmd.id}')
 
+        update_data = cmd.model_dump(exclude={'id'}, exclude_unset=True, exclude_none=True)
+
         original_ticket_price = event.ticket_price
         original_available_tickets = event.available_tickets
+        if 'available_tickets' in update_data:
+            original_available_tickets = await uow.inventory.available(event.id)  # type: ignore
 
-        update_data = cmd.model_dump(exclude={'id'}, exclude_unset=True, exclude_none=True)
         for field, value in update_data.items():
             setattr(event, field, value)
 
         uow.session.add(event)
 
+        if 'available_tickets' in update_data:
+            await uow.inventory.set_available(event.id, event.available_tickets)
+
+        # A sharded event's column only bounds its stock from above, so return the shard sum readers see
+        event.available_tickets = await uow.inventory.available(event.id)  # type: ignore
+
         if 'ticket_price' in update_data and event.ticket_price != original_ticket_price:
-            await publish.send_event(events.TicketPriceChanged(event_id=event.id, new_price=event.ticket_price))  # type: ignore
+            uow.outbox.add(events.TicketPriceChanged(event_id=event.id, new_price=event.ticket_price))  # type: ignore
 
         if 'available_tickets' in update_data and event.available_tickets < original_available_tickets:
-            await publish.send_event(
+            uow.outbox.add(
                 events.AvailableTicketsDecreased(event_id=event.id, remaining_tickets=event.available_tickets)  # type: ignore
             )
 
         await uow.commit()
+        views.invalidate(event.id)  # type: ignore
         return event
 
 
-async def delete_event(cmd: commands.DeleteEvent, uow: AbstractUnitOfWork, publish: AbstractEventPublisher) -> None:
+async def delete_event(cmd: commands.DeleteEvent, uow: AbstractUnitOfWork) -> None:
     async with uow:
         event = await uow.session.get(model.Event, cmd.id)
 
@@ -60,29 +101,132 @@ async def delete_event(cmd: commands.DeleteEvent, uow: AbstractUnitOfWork, publi
         uow.session.add(event)
 
         if event.event_datetime > datetime.now():
-            await publish.send_event(events.Deleted(event_id=event.id))  # type: ignore
+            uow.outbox.add(events.Deleted(event_id=event.id))  # type: ignore
 
         await uow.commit()
+        views.invalidate(cmd.id)
 
 
-async def sell_tickets(eve: events.TicketsSold, uow: AbstractUnitOfWork, publish: AbstractEventPublisher) -> None:
+async def update_events(cmd: commands.UpdateEvents, uow: AbstractUnitOfWork) -> None:
+    ids = [event.id for event in cmd.events]
+    changes = {
+        event.id: event.model_dump(exclude={'id'}, exclude_unset=True, exclude_none=True) for event in cmd.events
+    }
+
     async with uow:
-        event = await uow.session.get(model.Event, eve.event_id)
-        if not event:
-            raise InvalidId(f'Invalid id {eve.event_id}')
+        result = await uow.session.execute(
+            select(model.Event.id, model.Event.ticket_price, available_tickets()).where(model.Event.id.in_(ids))  # type: ignore
+        )
+        originals = {event_id: (ticket_price, tickets) for event_id, ticket_price, tickets in result.all()}
+
+        if missing := [event_id for event_id in ids if event_id not in originals]:
+            raise InvalidId(f'Invalid ids {missing}')
+
+        rows = sorted(({'id': event_id, **fields} for event_id, fields in changes.items()), key=lambda row: sorted(row))
+        await uow.session.execute(update(model.Event), rows)
+
+        notifications: list[events.Event] = []
+        for event_id, fields in changes.items():
+            original_ticket_price, original_available_tickets = originals[event_id]
+
+            if 'available_tickets' in fields:
+                await uow.inventory.set_available(event_id, fields['available_tickets'])
+
+            if 'ticket_price' in fields and fields['ticket_price'] != original_ticket_price:
+                notifications.append(events.TicketPriceChanged(event_id=event_id, new_price=fields['ticket_price']))
+
+            if 'available_tickets' in fields and fields['available_tickets'] < original_available_tickets:
+                notifications.append(
+                    events.AvailableTicketsDecreased(event_id=event_id, remaining_tickets=fields['available_tickets'])
+                )
+
+        uow.outbox.add_all(notifications)
+        await uow.commit()
 
-        event.available_tickets = event.available_tickets - eve.tickets_count
+    views.invalidate(*ids)
 
-        await publish.send_event(
-            events.AvailableTicketsDecreased(event_id=event.id, remaining_tickets=event.available_tickets)  # type: ignore
+
+async def delete_events(cmd: commands.DeleteEvents, uow: AbstractUnitOfWork) -> None:
+    async with uow:
+        result = await uow.session.execute(
+            update(model.Event)
+            .where(model.Event.id.in_(cmd.ids), model.Event.deleted_at.is_(None))  # type: ignore
+            .values(deleted_at=cmd.deleted_at)
+            .returning(model.Event.id, model.Event.event_datetime)
+            .execution_options(synchronize_session=False)
         )
+        deleted = dict(result.tuples().all())
+
+        if missing := [event_id for event_id in cmd.ids if event_id not in deleted]:
+            raise InvalidId(f'Invalid ids {missing}')
+
+        now = datetime.now()
+        uow.outbox.add_all(
+            events.Deleted(event_id=event_id) for event_id, event_datetime in deleted.items() if event_datetime > now
+        )
+        await uow.commit()
+
+    views.invalidate(*cmd.ids)
+
+
+async def decrement_available_tickets(uow: AbstractUnitOfWork, event_id: int, tickets_count: int) -> None:
+    remaining_tickets = await uow.inventory.decrement(event_id, tickets_count)
+
+    if remaining_tickets is None:
+        if not await uow.inventory.exists(event_id):
+            raise InvalidId(f'Invalid id {event_id}')
+        raise InsufficientTickets(f'Not enough tickets for event {event_id} to sell {tickets_count}')
+
+    uow.outbox.add(events.AvailableTicketsDecreased(event_id=event_id, remaining_tickets=remaining_tickets))
+
+
+async def sell_tickets(eve: events.TicketsSold, uow: AbstractUnitOfWork) -> None:
+    async with uow:
+        if eve.message_id is not None and not await uow.ledger.record([eve.message_id]):
+            return
+
+        await decrement_available_tickets(uow, eve.event_id, eve.tickets_count)
+        await uow.commit()
+        views.invalidate(eve.event_id)
+
+
+async def sell_tickets_batch(cmd: commands.SellTickets, uow: AbstractUnitOfWork) -> None:
+    async with uow:
+        recorded = await uow.ledger.record(sale.message_id for sale in cmd.sales if sale.message_id is not None)
+
+        tickets_count_by_event_id: Counter[int] = Counter()
+        for sale in cmd.sales:
+            if sale.message_id is not None:
+                if sale.message_id not in recorded:
+                    continue
+                recorded.discard(sale.message_id)
+            tickets_count_by_event_id[sale.event_id] += sale.tickets_count
+
+        for event_id, tickets_count in sorted(tickets_count_by_event_id.items()):
+            await decrement_available_tickets(uow, event_id, tickets_count)
+
+        await uow.commit()
+        views.invalidate(*tickets_count_by_event_id)
+
+
+async def shard_inventory(cmd: commands.ShardInventory, uow: AbstractUnitOfWork) -> None:
+    async with uow:
+        if not await uow.inventory.exists(cmd.id):
+            raise InvalidId(f'Invalid id {cmd.id}')
 
+        await uow.inventory.shard(cmd.id, cmd.shards)
         await uow.commit()
+        views.invalidate(cmd.id)
 
 
 HANDLERS: dict[type[commands.Command] | type[events.Event], Callable] = {
     commands.CreateEvent: create_event,
+    commands.CreateEvents: create_events,
     commands.DeleteEvent: delete_event,
     commands.UpdateEvent: update_event,
+    commands.UpdateEvents: update_events,
+    commands.DeleteEvents: delete_events,
     events.TicketsSold: sell_tickets,
+    commands.SellTickets: sell_tickets_batch,
+    commands.ShardInventory: shard_inventory,
 }
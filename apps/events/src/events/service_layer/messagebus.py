@@ -1,6 +1,5 @@
 from typing import Any
 
-from events.adapters.eventpublisher import AbstractEventPublisher
 from events.domain import commands, events
 from events.logger import logger
 from events.service_layer.handlers import HANDLERS
@@ -10,17 +9,16 @@ type Message = commands.Command | events.Event
 
 
 class MessageBus:
-    def __init__(self, uow: AbstractUnitOfWork, publish: AbstractEventPublisher):
+    def __init__(self, uow: AbstractUnitOfWork):
         self.uow = uow
-        self.publish = publish
 
     async def handle(self, message: Message) -> Any:
         result = None
-        logger.debug(f'handling {type(message).__name__} {message}')
+        logger.debug('handling {} {}', type(message).__name__, message)
         try:
             handler = HANDLERS[type(message)]
-            result = await handler(message, uow=self.uow, publish=self.publish)
+            result = await handler(message, uow=self.uow)
             return result
         except Exception as error:
-            logger.exception(f'Exception handling {type(message).__name__} {message}. {error}')
+            logger.exception('Exception handling {} {}. {}', type(message).__name__, message, error)
             raise error
@@ -1,10 +1,17 @@
 from typing import AsyncContextManager, Protocol
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from events.adapters.inventory import AbstractInventory, SqlAlchemyInventory
+from events.adapters.ledger import AbstractLedger, SqlAlchemyLedger
+from events.adapters.outbox import AbstractOutbox, SqlAlchemyOutbox
 
 
 class AbstractUnitOfWork(Protocol, AsyncContextManager):
     session: AsyncSession
+    outbox: AbstractOutbox
+    inventory: AbstractInventory
+    ledger: AbstractLedger
 
     async def commit(self):
         raise NotImplementedError
@@ -19,6 +26,9 @@ class SqlAlchemyUnitOfWork:
 
     async def __aenter__(self) -> AbstractUnitOfWork:
         self.session = self.session_factory()
+        self.outbox: AbstractOutbox = SqlAlchemyOutbox(self.session)
+        self.inventory: AbstractInventory = SqlAlchemyInventory(self.session)
+        self.ledger: AbstractLedger = SqlAlchemyLedger(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -30,3 +40,7 @@ class SqlAlchemyUnitOfWork:
 
     async def rollback(self):
         await self.session.rollback()
+
+
+def create_uow(engine: AsyncEngine) -> SqlAlchemyUnitOfWork:
+    return SqlAlchemyUnitOfWork(async_sessionmaker(engine))
@@ -6,9 +6,54 @@ POSTGRES_PORT = os.getenv('EVENTS_POSTGRES_PORT', '5432')
 POSTGRES_USER = os.environ['EVENTS_POSTGRES_USER']
 POSTGRES_PASSWORD = os.environ['EVENTS_POSTGRES_PASSWORD']
 POSTGRES_URL = f'postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}'
+POSTGRES_POOL_SIZE = int(os.getenv('EVENTS_POSTGRES_POOL_SIZE', '10'))
+POSTGRES_MAX_OVERFLOW = int(os.getenv('EVENTS_POSTGRES_MAX_OVERFLOW', '10'))
+POSTGRES_POOL_TIMEOUT = float(os.getenv('EVENTS_POSTGRES_POOL_TIMEOUT', '30'))
+POSTGRES_POOL_RECYCLE = int(os.getenv('EVENTS_POSTGRES_POOL_RECYCLE', '1800'))
+POSTGRES_POOL_PRE_PING = os.getenv('EVENTS_POSTGRES_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+POSTGRES_STATEMENT_CACHE_SIZE = int(os.getenv('EVENTS_POSTGRES_STATEMENT_CACHE_SIZE', '500'))
+POSTGRES_STATEMENT_TIMEOUT_MS = int(os.getenv('EVENTS_POSTGRES_STATEMENT_TIMEOUT_MS', '30000'))
 
 RABBITMQ_USER = os.environ['RABBITMQ_DEFAULT_USER']
 RABBITMQ_PASS = os.environ['RABBITMQ_DEFAULT_PASS']
 RABBITMQ_HOST = os.getenv('RABBITMQ_DEFAULT_HOST', 'rabbitmq')
 RABBITMQ_PORT = os.getenv('RABBITMQ_DEFAULT_PORT', '5672')
 RABBITMQ_URL = f'amqp://{RABBITMQ_USER}:{RABBITMQ_PASS}@{RABBITMQ_HOST}:{RABBITMQ_PORT}'
+RABBITMQ_CHANNEL_POOL_SIZE = int(os.getenv('RABBITMQ_CHANNEL_POOL_SIZE', '10'))
+RABBITMQ_CONTENT_TYPE = os.getenv('RABBITMQ_CONTENT_TYPE', 'application/json')
+RABBITMQ_PUBLISHER_CONFIRMS = os.getenv('RABBITMQ_PUBLISHER_CONFIRMS', 'true').lower() in ('1', 'true', 'yes')
+RABBITMQ_CONFIRM_WINDOW = int(os.getenv('RABBITMQ_CONFIRM_WINDOW', '256'))
+RABBITMQ_CONFIRM_TIMEOUT = float(os.getenv('RABBITMQ_CONFIRM_TIMEOUT', '10'))
+
+OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', '100'))
+OUTBOX_POLL_INTERVAL = float(os.getenv('OUTBOX_POLL_INTERVAL', '0.5'))
+
+CONSUMER_PREFETCH_COUNT = int(os.getenv('CONSUMER_PREFETCH_COUNT', '20'))
+CONSUMER_CONCURRENCY = int(os.getenv('CONSUMER_CONCURRENCY', '10'))
+CONSUMER_DISPATCH_MODE = os.getenv('CONSUMER_DISPATCH_MODE', 'concurrent')
+CONSUMER_LANES = int(os.getenv('CONSUMER_LANES', '8'))
+CONSUMER_BATCH_SIZE = int(os.getenv('CONSUMER_BATCH_SIZE', '100'))
+CONSUMER_BATCH_TIMEOUT_MS = int(os.getenv('CONSUMER_BATCH_TIMEOUT_MS', '50'))
+CONSUMER_WORKERS = int(os.getenv('CONSUMER_WORKERS', '1'))
+CONSUMER_DRAIN_TIMEOUT = float(os.getenv('CONSUMER_DRAIN_TIMEOUT', '30'))
+CONSUMER_HEALTH_PORT = int(os.getenv('CONSUMER_HEALTH_PORT', '8081'))
+CONSUMER_MAX_ATTEMPTS = int(os.getenv('CONSUMER_MAX_ATTEMPTS', '5'))
+CONSUMER_RETRY_DELAY_MS = int(os.getenv('CONSUMER_RETRY_DELAY_MS', '1000'))
+CONSUMER_DEDUP_SIZE = int(os.getenv('CONSUMER_DEDUP_SIZE', '100000'))
+CONSUMER_DEDUP_TTL = float(os.getenv('CONSUMER_DEDUP_TTL', '3600'))
+
+LEDGER_RETENTION = float(os.getenv('LEDGER_RETENTION', str(7 * 24 * 3600)))
+LEDGER_EXPIRY_BATCH_SIZE = int(os.getenv('LEDGER_EXPIRY_BATCH_SIZE', '1000'))
+LEDGER_EXPIRY_INTERVAL = float(os.getenv('LEDGER_EXPIRY_INTERVAL', '60'))
+EMBEDDED_CONSUMER = os.getenv('EVENTS_EMBEDDED_CONSUMER', 'true').lower() in ('1', 'true', 'yes')
+
+EVENT_CACHE_SIZE = int(os.getenv('EVENT_CACHE_SIZE', '10000'))
+EVENT_CACHE_TTL = float(os.getenv('EVENT_CACHE_TTL', '5'))
+
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+
+LOG_BODY_SAMPLE_RATE = float(os.getenv('LOG_BODY_SAMPLE_RATE', '0'))
+LOG_BODY_MAX_SIZE = int(os.getenv('LOG_BODY_MAX_SIZE', '4096'))
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_JSON = os.getenv('LOG_JSON', 'false').lower() in ('1', 'true', 'yes')
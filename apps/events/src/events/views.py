@@ -1,15 +1,62 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, Select, literal_column, select, tuple_
 
+from events import metrics
+from events.adapters.cache import AbstractCache, NullCache, TTLCache
+from events.adapters.inventory import available_tickets
 from events.domain.model import Event
 from events.service_layer.unit_of_work import AbstractUnitOfWork
+from events.settings import EVENT_CACHE_SIZE, EVENT_CACHE_TTL
+
+cache: AbstractCache = TTLCache(maxsize=EVENT_CACHE_SIZE, ttl=EVENT_CACHE_TTL) if EVENT_CACHE_SIZE else NullCache()
+
+
+def use_cache(new_cache: AbstractCache) -> None:
+    global cache
+    cache = new_cache
+
+
+def invalidate(*event_ids: int) -> None:
+    for event_id in event_ids:
+        cache.delete(event_id)
+
+
+metrics.gauge('event_cache_hits', lambda: cache.hits)
+metrics.gauge('event_cache_misses', lambda: cache.misses)
+metrics.gauge('event_cache_size', lambda: len(cache))
+
+
+def public_columns() -> Select:
+    return select(  # type: ignore
+        Event.id,
+        Event.name,
+        Event.description,
+        Event.event_datetime,
+        available_tickets().label('available_tickets'),
+        Event.ticket_price,
+        Event.deleted_at,
+    )
+
+
+def to_event(row: RowMapping) -> Event:
+    return Event.model_construct(**row)
 
 
 async def event(uow: AbstractUnitOfWork, event_id: int) -> Event | None:
+    if cached := cache.get(event_id):
+        return cached
+
     async with uow:
-        event = await uow.session.get(Event, event_id)
-        return event.model_copy() if event else None
+        result = await uow.session.execute(public_columns().where(Event.id == event_id))  # type: ignore
+        row = result.mappings().first()
+        if not row:
+            return None
+
+        event = to_event(row)
+        cache.set(event_id, event)
+        return event
 
 
 async def events(
@@ -18,19 +65,53 @@ async def events(
     datetime_to: datetime | None,
     page: int = 1,
     items_count: int = 20,
+    after: tuple[datetime, int] | None = None,
 ) -> list[Event]:
     async with uow:
-        query = select(Event).where(Event.available_tickets > 0)  # type: ignore
+        # Inlined literal so generic prepared plans still match the idx_event_listing predicate; the raw column only
+        # bounds sharded stock from above, so the displayed shard sum is filtered on as well
+        query = public_columns().where(
+            Event.available_tickets > literal_column('0'),  # type: ignore
+            Event.deleted_at.is_(None),  # type: ignore
+            available_tickets() > 0,
+        )
 
         if datetime_from:
             query = query.where(Event.event_datetime >= datetime_from)  # type: ignore
         if datetime_to:
             query = query.where(Event.event_datetime <= datetime_to)  # type: ignore
 
-        offset = (page - 1) * items_count
-        query = query.offset(offset).limit(items_count)
+        query = query.order_by(Event.event_datetime, Event.id)  # type: ignore
+
+        if after:
+            query = query.where(tuple_(Event.event_datetime, Event.id) > tuple_(*after))  # type: ignore
+        else:
+            query = query.offset((page - 1) * items_count)
+
+        query = query.limit(items_count)
 
         result = await uow.session.execute(query)
-        events = result.scalars().all()
 
-        return [event.model_copy() for event in events]
+        return [to_event(row) for row in result.mappings()]
+
+
+async def stream_events(
+    uow: AbstractUnitOfWork, datetime_from: datetime, batch_size: int = 1000
+) -> AsyncIterator[list[Event]]:
+    async with uow:
+        query = (
+            public_columns()
+            .where(
+                Event.available_tickets > literal_column('0'),  # type: ignore
+                Event.deleted_at.is_(None),  # type: ignore
+                available_tickets() > 0,
+                Event.event_datetime >= datetime_from,  # type: ignore
+            )
+            .order_by(Event.event_datetime, Event.id)  # type: ignore
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await uow.session.stream(query)
+
+        async for rows in result.mappings().partitions():
+            yield [to_event(row) for row in rows]
@@ -14,10 +14,13 @@ from sqlmodel import SQLModel, text
 from testcontainers.postgres import PostgresContainer
 from testcontainers.rabbitmq import RabbitMqContainer
 
+from events import views
 from events.adapters.eventpublisher import FakeEventPublisher, RabbitMQEventPublisher
+from events.domain import events
 from events.domain.model import Event
 from events.entrypoints.eventconsumer import RabbitMQEventConsumer
 from events.entrypoints.fastapi.main import app
+from events.entrypoints.outboxrelay import OutboxRelay
 from events.service_layer.messagebus import MessageBus
 from events.service_layer.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -41,6 +44,40 @@ async def select_event_by_name(uow: SqlAlchemyUnitOfWork, name):
         return event._asdict() if event else event
 
 
+async def select_outbox_events(uow: SqlAlchemyUnitOfWork):
+    async with uow:
+        messages = await uow.outbox.pending(limit=1000)
+        return [message.to_event().model_copy(update={'message_id': None}) for message in messages]
+
+
+class FakeIncomingMessage:
+    info: dict = {}
+    content_type = None
+
+    def __init__(self, event: events.Event, message_id: str | None = None, headers: dict | None = None):
+        self.body = event.model_dump_json().encode()
+        self.message_id = message_id
+        self.headers = headers or {}
+        self.acked = False
+
+    async def ack(self):
+        self.acked = True
+
+
+class FakeChannel:
+    def __init__(self):
+        self.published: list[tuple[str, aio_pika.Message]] = []
+        self.default_exchange = self
+
+    async def publish(self, message: aio_pika.Message, routing_key: str, **kwargs):
+        self.published.append((routing_key, message))
+
+
+@pytest.fixture(autouse=True)
+def clear_event_cache():
+    views.cache.clear()
+
+
 @pytest.fixture
 def fake_event() -> dict:
     return {
@@ -111,11 +148,15 @@ def uow(sqlite_session_factory: async_sessionmaker[AsyncSession]) -> SqlAlchemyU
 
 @pytest.fixture
 def bus(uow: SqlAlchemyUnitOfWork) -> MessageBus:
-    publish = FakeEventPublisher()
-    messagebus = MessageBus(uow, publish)
+    messagebus = MessageBus(uow)
     return messagebus
 
 
+@pytest.fixture
+def fake_publisher() -> FakeEventPublisher:
+    return FakeEventPublisher()
+
+
 @pytest.fixture
 def fake_events():
     def event_factory(i):
@@ -166,15 +207,15 @@ def rmq_url(rabbitmq_container: RabbitMqContainer) -> str:
 
 
 @pytest.fixture
-def rabbitmq_event_publisher(rmq_url: str) -> RabbitMQEventPublisher:
-    publish = RabbitMQEventPublisher(rmq_url)
-    return publish
+async def rabbitmq_event_publisher(rmq_url: str) -> AsyncGenerator[RabbitMQEventPublisher]:
+    async with RabbitMQEventPublisher(rmq_url) as publish:
+        yield publish
 
 
 @pytest.fixture
-def rabbitmq_orders_event_publisher(request, rmq_url: str) -> RabbitMQEventPublisher:
-    publish = RabbitMQEventPublisher(rmq_url, queue_name='orders')
-    return publish
+async def rabbitmq_orders_event_publisher(request, rmq_url: str) -> AsyncGenerator[RabbitMQEventPublisher]:
+    async with RabbitMQEventPublisher(rmq_url, queue_name='orders') as publish:
+        yield publish
 
 
 @pytest.fixture
@@ -195,11 +236,24 @@ def pg_uow(postgres_session_factory: async_sessionmaker[AsyncSession]) -> SqlAlc
 
 
 @pytest.fixture
-def pg_bus(pg_uow: SqlAlchemyUnitOfWork, rabbitmq_event_publisher: RabbitMQEventPublisher) -> MessageBus:
-    messagebus = MessageBus(pg_uow, rabbitmq_event_publisher)
+def pg_bus(pg_uow: SqlAlchemyUnitOfWork) -> MessageBus:
+    messagebus = MessageBus(pg_uow)
     return messagebus
 
 
+@pytest.fixture
+async def outbox_relay(
+    postgres_session_factory: async_sessionmaker[AsyncSession], rabbitmq_event_publisher: RabbitMQEventPublisher
+) -> AsyncGenerator[OutboxRelay]:
+    relay = OutboxRelay(SqlAlchemyUnitOfWork(postgres_session_factory), rabbitmq_event_publisher, poll_interval=0.1)
+
+    task = asyncio.create_task(relay.run())
+
+    yield relay
+
+    task.cancel()
+
+
 @pytest.fixture
 async def pg_fake_events(pg_uow: SqlAlchemyUnitOfWork, fake_events: list[Event]) -> AsyncGenerator[Event]:
     async with pg_uow as uow:
@@ -230,8 +284,12 @@ async def api_client(pg_bus: MessageBus) -> AsyncGenerator[TestClient]:
 
 
 @pytest.fixture
-async def event_consumer(bus: MessageBus, rmq_url: str) -> AsyncGenerator[RabbitMQEventConsumer]:
-    consumer = RabbitMQEventConsumer(bus=bus, rabbitmq_url=rmq_url)
+async def event_consumer(
+    sqlite_session_factory: async_sessionmaker[AsyncSession], rmq_url: str
+) -> AsyncGenerator[RabbitMQEventConsumer]:
+    consumer = RabbitMQEventConsumer(
+        bus_factory=lambda: MessageBus(SqlAlchemyUnitOfWork(sqlite_session_factory)), rabbitmq_url=rmq_url
+    )
 
     task = asyncio.create_task(consumer.consume())
 
@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 from datetime import datetime, timedelta
 
 import pytest
@@ -95,6 +98,62 @@ class TestForUserRouter:
 
             assert returned_events == expected_events
 
+        def test_returns_next_cursor_and_walks_all_events_by_cursor(self, api_client, pg_fake_events):
+            expected_ids = [
+                event.id
+                for event in pg_fake_events
+                if event.event_datetime > datetime.now() and event.available_tickets > 0
+            ]
+
+            returned_ids, params = [], {'items_count': 3}
+            while True:
+                response = api_client.get('/events/', params=params)
+                assert response.status_code == status.HTTP_200_OK
+                returned_ids.extend(event['id'] for event in response.json())
+
+                if 'X-Next-Cursor' not in response.headers:
+                    break
+                params['cursor'] = response.headers['X-Next-Cursor']
+
+            assert returned_ids == expected_ids
+
+        def test_exports_upcoming_events_as_ndjson(self, api_client, pg_fake_events):
+            expected_events = [
+                event.model_dump(mode='json', exclude={'deleted_at'})
+                for event in pg_fake_events
+                if event.event_datetime > datetime.now() and event.available_tickets > 0
+            ]
+
+            response = api_client.get('/events/export')
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers['content-type'] == 'application/x-ndjson'
+            assert [json.loads(line) for line in response.text.splitlines()] == expected_events
+
+        def test_exports_upcoming_events_as_csv(self, api_client, pg_fake_events):
+            expected_ids = [
+                str(event.id)
+                for event in pg_fake_events
+                if event.event_datetime > datetime.now() and event.available_tickets > 0
+            ]
+
+            response = api_client.get('/events/export', params={'format': 'csv'})
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers['content-type'].startswith('text/csv')
+            assert [row['id'] for row in csv.DictReader(io.StringIO(response.text))] == expected_ids
+
+        def test_returns_400_if_invalid_cursor(self, api_client):
+            response = api_client.get('/events/', params={'cursor': 'invalid'})
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json() == {'detail': 'Invalid cursor'}
+
+        def test_returns_422_if_items_count_is_too_big(self, api_client):
+            response = api_client.get('/events/', params={'items_count': 1000})
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
         @pytest.mark.parametrize(('from_delta', 'to_delta'), [(5, 2), (10, 1)])
         def test_returns_400_if_invalid_date_range(self, api_client, from_delta, to_delta):
             now = datetime.now()
@@ -181,6 +240,48 @@ class TestForAdminRouter:
             assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
             assert 'The datetime of the event cannot be the previous one' in response.text
 
+    class TestPostEventsBulk:
+        def test_returns_200_with_ids_and_per_item_errors(self, api_client, fake_event):
+            fake_event['event_datetime'] = fake_event['event_datetime'].strftime('%Y-%m-%dT%H:%M')
+            items = [fake_event, {**fake_event, 'available_tickets': -1}, {**fake_event, 'name': 'Second'}]
+
+            response = api_client.post('/events/bulk', json={'events': items})
+            assert response.status_code == status.HTTP_200_OK
+
+            result = response.json()
+            assert result['ids'] == [1, None, 2]
+            assert [error['index'] for error in result['errors']] == [1]
+            assert api_client.get('/events/2').json()['name'] == 'Second'
+
+        def test_returns_422_if_batch_is_empty(self, api_client):
+            response = api_client.post('/events/bulk', json={'events': []})
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    class TestBulkUpdateAndDelete:
+        def test_returns_200_and_updates_events(self, api_client, pg_fake_events):
+            first, second = pg_fake_events[-2:]
+            body = {'events': [{'id': first.id, 'name': 'Bulk renamed'}, {'id': second.id, 'ticket_price': 1}]}
+
+            response = api_client.put('/events/bulk', json=body)
+            assert response.status_code == status.HTTP_200_OK
+
+            assert api_client.get(f'/events/{first.id}').json()['name'] == 'Bulk renamed'
+            assert api_client.get(f'/events/{second.id}').json()['ticket_price'] == 1
+
+        def test_returns_200_and_deletes_events(self, api_client, pg_fake_events):
+            ids = [event.id for event in pg_fake_events[-2:]]
+
+            response = api_client.delete('/events/bulk', params={'ids': ids})
+            assert response.status_code == status.HTTP_200_OK
+
+            assert all(api_client.get(f'/events/{id}').json()['deleted_at'] is not None for id in ids)
+
+        def test_returns_404_if_one_id_does_not_exist(self, api_client, pg_fake_events):
+            response = api_client.delete('/events/bulk', params={'ids': [pg_fake_events[-1].id, 999]})
+
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            assert api_client.get(f'/events/{pg_fake_events[-1].id}').json()['deleted_at'] is None
+
     class TestDeleteEvent:
         async def test_return_200_and_event_deleted_if_you_delete_exists_event(self, api_client, pg_fake_events):
             event_for_delete_id = pg_fake_events[-1].id
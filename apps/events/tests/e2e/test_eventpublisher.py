@@ -1,7 +1,11 @@
+import asyncio
 import json
 
 import pytest
 
+from events.adapters.eventpublisher import RabbitMQEventPublisher
+from events.domain.events import Deleted
+
 pytestmark = pytest.mark.e2e
 
 
@@ -16,7 +20,9 @@ async def assert_event_published(queue_iter, expected_message):
     assert expected_message == deserialize_message
 
 
-async def test_published_the_deleted_event_if_delete_event(api_client, pg_fake_events, rabbitmq_events_queue_iter):
+async def test_published_the_deleted_event_if_delete_event(
+    api_client, pg_fake_events, outbox_relay, rabbitmq_events_queue_iter
+):
     event_to_delete_id = pg_fake_events[-1].id
 
     api_client.delete(f'/events/{event_to_delete_id}')
@@ -27,7 +33,7 @@ async def test_published_the_deleted_event_if_delete_event(api_client, pg_fake_e
 
 
 async def test_published_the_ticket_price_changed_event_if_update_event_price(
-    api_client, pg_fake_events, rabbitmq_events_queue_iter
+    api_client, pg_fake_events, outbox_relay, rabbitmq_events_queue_iter
 ):
     event_to_update = pg_fake_events[-1]
     update_data = {'ticket_price': str(event_to_update.ticket_price - 100)}
@@ -44,7 +50,7 @@ async def test_published_the_ticket_price_changed_event_if_update_event_price(
 
 
 async def test_published_the_available_tickets_decreased_event_if_decrease_available_tickets(
-    api_client, pg_fake_events, rabbitmq_events_queue_iter
+    api_client, pg_fake_events, outbox_relay, rabbitmq_events_queue_iter
 ):
     event_to_update = pg_fake_events[-1]
     update_data = {'available_tickets': event_to_update.available_tickets - 5}
@@ -58,3 +64,28 @@ async def test_published_the_available_tickets_decreased_event_if_decrease_avail
     }
 
     await assert_event_published(rabbitmq_events_queue_iter, expected_message)
+
+
+async def test_publisher_reuses_one_connection_for_many_events(rabbitmq_event_publisher, rabbitmq_events_queue_iter):
+    connection = rabbitmq_event_publisher._connection
+
+    await asyncio.gather(
+        *(rabbitmq_event_publisher.send_event(Deleted(event_id=event_id)) for event_id in range(1, 51)),
+    )
+
+    assert rabbitmq_event_publisher._connection is connection
+    await assert_event_published(rabbitmq_events_queue_iter, {'name': 'Deleted', 'event_id': 50})
+
+
+async def test_publisher_reopens_connection_after_close(rmq_url, rabbitmq_events_queue_iter):
+    publisher = RabbitMQEventPublisher(rmq_url)
+
+    await publisher.send_event(Deleted(event_id=1))
+    await publisher.close()
+    assert not publisher.is_open
+
+    await publisher.send_event(Deleted(event_id=2))
+    assert publisher.is_open
+    await publisher.close()
+
+    await assert_event_published(rabbitmq_events_queue_iter, {'name': 'Deleted', 'event_id': 2})
@@ -0,0 +1,48 @@
+import aio_pika
+import pytest
+
+from events.domain import events
+from events.entrypoints.dlq import list_messages, replay_messages
+
+pytestmark = pytest.mark.integration
+
+QUEUE_NAME = 'dlq-test'
+
+
+@pytest.fixture
+async def channel(rmq_url: str):
+    connection = await aio_pika.connect(rmq_url)
+    async with connection:
+        channel = await connection.channel()
+        await channel.declare_queue(QUEUE_NAME, durable=True)
+        dead_letters = await channel.declare_queue(f'{QUEUE_NAME}.dlq', durable=True)
+        await channel.default_exchange.publish(
+            aio_pika.Message(
+                body=events.TicketsSold(event_id=1, tickets_count=1).model_dump_json().encode(),
+                headers={'x-attempt': 5, 'x-last-error': "InvalidId('Invalid id 1')"},
+                message_id='message-1',
+            ),
+            routing_key=dead_letters.name,
+        )
+        yield channel
+        await channel.queue_delete(QUEUE_NAME)
+        await channel.queue_delete(dead_letters.name)
+
+
+async def test_list_leaves_messages_in_dead_letter_queue(rmq_url: str, channel, capsys: pytest.CaptureFixture):
+    assert await list_messages(rmq_url, QUEUE_NAME, limit=10) == 1
+    assert await list_messages(rmq_url, QUEUE_NAME, limit=10) == 1
+
+    assert "message-1\tattempts=5\terror=InvalidId('Invalid id 1')" in capsys.readouterr().out
+
+
+async def test_replay_moves_messages_back_without_retry_headers(rmq_url: str, channel):
+    assert await replay_messages(rmq_url, QUEUE_NAME, limit=10) == 1
+    assert await list_messages(rmq_url, QUEUE_NAME, limit=10) == 0
+
+    queue = await channel.declare_queue(QUEUE_NAME, durable=True)
+    message = await queue.get(no_ack=True, timeout=5)
+
+    assert message.message_id == 'message-1'
+    assert 'x-attempt' not in message.headers
+    assert 'x-last-error' not in message.headers
@@ -1,7 +1,12 @@
+import json
+from datetime import datetime
+
 import pytest
-from sqlalchemy import text
+from sqlalchemy import literal_column, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from events.domain.model import Event
+
 pytestmark = pytest.mark.integration
 
 
@@ -86,3 +91,30 @@ async def test_cant_insert_event_with_negative_ticket_price(postgres_session: As
 
     with pytest.raises(Exception, match='check_ticket_price_positive'):
         await postgres_session.execute(query, fake_event)
+
+
+async def test_listing_uses_partial_index_at_scale(postgres_session: AsyncSession):
+    await postgres_session.execute(
+        text("""
+            INSERT INTO event (name, description, event_datetime, available_tickets, ticket_price, deleted_at)
+            SELECT 'Event ' || i, 'Description', now() + i * interval '1 minute', i % 3, 100,
+                   CASE WHEN i % 5 = 0 THEN now() END
+            FROM generate_series(1, 20000) AS i
+        """)
+    )
+    await postgres_session.execute(text('ANALYZE event'))
+
+    query = select(Event.id).where(  # type: ignore
+        Event.available_tickets > literal_column('0'),  # type: ignore
+        Event.deleted_at.is_(None),  # type: ignore
+        Event.event_datetime >= datetime.now(),
+    )
+    query = query.order_by(Event.event_datetime, Event.id).limit(20)  # type: ignore
+    compiled = query.compile(postgres_session.bind, compile_kwargs={'literal_binds': True})  # type: ignore
+
+    result = await postgres_session.execute(text(f'EXPLAIN (FORMAT JSON) {compiled}'))
+    plan = json.dumps(result.scalar())
+
+    assert 'idx_event_listing' in plan
+    assert '"Index Only Scan"' in plan or '"Index Scan"' in plan
+    assert '"Seq Scan"' not in plan
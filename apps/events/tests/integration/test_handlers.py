@@ -4,10 +4,18 @@ from datetime import datetime, timedelta
 import pytest
 
 from events.domain import events, model
-from events.domain.commands import CreateEvent, DeleteEvent, UpdateEvent
-from events.service_layer.handlers import InvalidId
+from events.domain.commands import (
+    CreateEvent,
+    CreateEvents,
+    DeleteEvent,
+    DeleteEvents,
+    SellTickets,
+    UpdateEvent,
+    UpdateEvents,
+)
+from events.service_layer.handlers import InsufficientTickets, InvalidId
 from events.service_layer.messagebus import MessageBus
-from tests.conftest import select_event_by_name
+from tests.conftest import select_event_by_name, select_outbox_events
 
 pytestmark = pytest.mark.integration
 
@@ -23,6 +31,34 @@ class TestCreateEvent:
         assert event['ticket_price'] == fake_event['ticket_price']
 
 
+class TestCreateEvents:
+    async def test_can_create_events_in_one_batch(self, bus: MessageBus, fake_event: dict):
+        items = [{**fake_event, 'name': f'Bulk Event {i}'} for i in range(3)]
+
+        result = await bus.handle(CreateEvents(events=items))
+
+        assert result.errors == []
+        for item, event_id in zip(items, result.ids, strict=True):
+            event = await select_event_by_name(bus.uow, name=item['name'])
+            assert event['id'] == event_id
+
+    async def test_invalid_items_are_reported_without_aborting_batch(self, bus: MessageBus, fake_event: dict):
+        items = [
+            {**fake_event, 'name': 'Valid Event'},
+            {**fake_event, 'ticket_price': -1},
+            {'name': 'Incomplete Event'},
+        ]
+
+        result = await bus.handle(CreateEvents(events=items))
+
+        assert result.ids[0] is not None
+        assert result.ids[1:] == [None, None]
+        assert [error.index for error in result.errors] == [1, 2]
+        assert result.errors[0].errors[0]['loc'] == ('ticket_price',)
+        assert await select_event_by_name(bus.uow, name='Valid Event')
+        assert not await select_event_by_name(bus.uow, name='Incomplete Event')
+
+
 class TestUpdateEvent:
     async def test_can_update_event(self, bus: MessageBus, fake_event: dict):
         event = await bus.handle(CreateEvent(**fake_event))
@@ -54,7 +90,7 @@ class TestUpdateEvent:
         expected_event = events.TicketPriceChanged(event_id=event.id, new_price=new_price)
 
         await bus.handle(UpdateEvent(id=event.id, ticket_price=new_price))
-        assert expected_event in bus.publish.messages
+        assert expected_event in await select_outbox_events(bus.uow)
 
     async def test_available_tickets_decreased_event_sended_when_decrease_event_available_tickets(
         self, bus: MessageBus, fake_event: dict
@@ -66,7 +102,7 @@ class TestUpdateEvent:
         expected_event = events.AvailableTicketsDecreased(event_id=event.id, remaining_tickets=new_available_tickets)
 
         await bus.handle(UpdateEvent(id=event.id, available_tickets=new_available_tickets))
-        assert expected_event in bus.publish.messages
+        assert expected_event in await select_outbox_events(bus.uow)
 
     async def test_cant_update_non_existent_event(self, bus: MessageBus, fake_event: dict):
         with pytest.raises(InvalidId, match='Invalid id'):
@@ -92,7 +128,7 @@ class TestDeleteEvent:
 
         await bus.handle(DeleteEvent(id=event.id))
 
-        assert expected_event in bus.publish.messages
+        assert expected_event in await select_outbox_events(bus.uow)
 
     async def test_cant_delete_non_existent_event(self, bus: MessageBus, fake_event: dict):
         with pytest.raises(InvalidId, match='Invalid id'):
@@ -108,7 +144,79 @@ class TestDeleteEvent:
         await bus.handle(DeleteEvent(id=event.id))
 
         unexpected_event = events.Deleted(event_id=event.id)
-        assert unexpected_event not in bus.publish.messages
+        assert unexpected_event not in await select_outbox_events(bus.uow)
+
+
+class TestUpdateEvents:
+    async def test_can_update_events_with_different_fields_in_one_batch(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        first, second = sqlite_fake_events[-2:]
+
+        await bus.handle(
+            UpdateEvents(
+                events=[
+                    UpdateEvent(id=first.id, name='Rescheduled', event_datetime=datetime.now() + timedelta(days=40)),
+                    UpdateEvent(id=second.id, ticket_price=second.ticket_price + 1),
+                ]
+            )
+        )
+
+        assert (await select_event_by_name(bus.uow, name='Rescheduled'))['id'] == first.id
+        assert (await select_event_by_name(bus.uow, name=second.name))['ticket_price'] == second.ticket_price + 1
+
+    async def test_notifications_are_recorded_for_the_whole_batch(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        first, second = sqlite_fake_events[-2:]
+
+        await bus.handle(
+            UpdateEvents(
+                events=[
+                    UpdateEvent(id=first.id, ticket_price=first.ticket_price + 1),
+                    UpdateEvent(id=second.id, available_tickets=second.available_tickets - 1),
+                ]
+            )
+        )
+
+        assert await select_outbox_events(bus.uow) == [
+            events.TicketPriceChanged(event_id=first.id, new_price=first.ticket_price + 1),
+            events.AvailableTicketsDecreased(event_id=second.id, remaining_tickets=second.available_tickets - 1),
+        ]
+
+    async def test_batch_is_rolled_back_if_one_id_is_invalid(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        event = sqlite_fake_events[-1]
+
+        with pytest.raises(InvalidId, match='Invalid ids'):
+            await bus.handle(
+                UpdateEvents(events=[UpdateEvent(id=event.id, name='Renamed'), UpdateEvent(id=999, name='x')])
+            )
+
+        assert await select_event_by_name(bus.uow, name='Renamed') is None
+
+
+class TestDeleteEvents:
+    async def test_can_delete_events_in_one_batch(self, bus: MessageBus, sqlite_fake_events: list[model.Event]):
+        deleted = sqlite_fake_events[-3:]
+
+        await bus.handle(DeleteEvents(ids=[event.id for event in deleted]))
+
+        for event in deleted:
+            assert (await select_event_by_name(bus.uow, name=event.name))['deleted_at'] is not None
+        assert await select_outbox_events(bus.uow) == [events.Deleted(event_id=event.id) for event in deleted]
+
+    async def test_batch_is_rolled_back_if_one_event_is_already_deleted(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        first, second = sqlite_fake_events[-2:]
+        await bus.handle(DeleteEvent(id=second.id))
+
+        with pytest.raises(InvalidId, match=f'Invalid ids \\[{second.id}\\]'):
+            await bus.handle(DeleteEvents(ids=[first.id, second.id]))
+
+        assert (await select_event_by_name(bus.uow, name=first.name))['deleted_at'] is None
 
 
 class TestSellTickets:
@@ -126,3 +234,76 @@ class TestSellTickets:
 
         with pytest.raises(InvalidId, match=f'Invalid id {invalid_event_id}'):
             await bus.handle(events.TicketsSold(event_id=invalid_event_id, tickets_count=3))
+
+    async def test_available_tickets_decreased_event_sended_with_remaining_tickets(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        event_to_sell_tickets = sqlite_fake_events[-1]
+
+        await bus.handle(events.TicketsSold(event_id=event_to_sell_tickets.id, tickets_count=3))
+
+        expected_event = events.AvailableTicketsDecreased(
+            event_id=event_to_sell_tickets.id, remaining_tickets=event_to_sell_tickets.available_tickets - 3
+        )
+        assert await select_outbox_events(bus.uow) == [expected_event]
+
+    async def test_cant_sell_more_tickets_than_available(self, bus: MessageBus, sqlite_fake_events: list[model.Event]):
+        event_to_sell_tickets = sqlite_fake_events[-1]
+
+        with pytest.raises(InsufficientTickets, match=f'Not enough tickets for event {event_to_sell_tickets.id}'):
+            await bus.handle(
+                events.TicketsSold(
+                    event_id=event_to_sell_tickets.id, tickets_count=event_to_sell_tickets.available_tickets + 1
+                )
+            )
+
+        async with bus.uow as uow:
+            event = await uow.session.get(model.Event, event_to_sell_tickets.id)
+            assert event.available_tickets == event_to_sell_tickets.available_tickets
+        assert await select_outbox_events(bus.uow) == []
+
+    async def test_cant_sell_tickets_for_deleted_event(self, bus: MessageBus, sqlite_fake_events: list[model.Event]):
+        event_to_sell_tickets = sqlite_fake_events[-1]
+        await bus.handle(DeleteEvent(id=event_to_sell_tickets.id))
+
+        with pytest.raises(InvalidId, match=f'Invalid id {event_to_sell_tickets.id}'):
+            await bus.handle(events.TicketsSold(event_id=event_to_sell_tickets.id, tickets_count=1))
+
+
+class TestSellTicketsBatch:
+    async def test_can_sell_tickets_for_many_events_in_one_batch(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        first, second = sqlite_fake_events[-2:]
+        sales = [
+            events.TicketsSold(event_id=first.id, tickets_count=1),
+            events.TicketsSold(event_id=second.id, tickets_count=2),
+            events.TicketsSold(event_id=first.id, tickets_count=3),
+        ]
+
+        await bus.handle(SellTickets(sales=sales))
+
+        async with bus.uow as uow:
+            assert (await uow.session.get(model.Event, first.id)).available_tickets == first.available_tickets - 4
+            assert (await uow.session.get(model.Event, second.id)).available_tickets == second.available_tickets - 2
+
+        assert await select_outbox_events(bus.uow) == [
+            events.AvailableTicketsDecreased(event_id=first.id, remaining_tickets=first.available_tickets - 4),
+            events.AvailableTicketsDecreased(event_id=second.id, remaining_tickets=second.available_tickets - 2),
+        ]
+
+    async def test_batch_is_rolled_back_if_one_sale_has_invalid_id(
+        self, bus: MessageBus, sqlite_fake_events: list[model.Event]
+    ):
+        event = sqlite_fake_events[-1]
+        sales = [
+            events.TicketsSold(event_id=event.id, tickets_count=1),
+            events.TicketsSold(event_id=9999, tickets_count=1),
+        ]
+
+        with pytest.raises(InvalidId, match='Invalid id 9999'):
+            await bus.handle(SellTickets(sales=sales))
+
+        async with bus.uow as uow:
+            assert (await uow.session.get(model.Event, event.id)).available_tickets == event.available_tickets
+        assert await select_outbox_events(bus.uow) == []
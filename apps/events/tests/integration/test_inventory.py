@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import select
+
+from events import views
+from events.domain import events, model
+from events.domain.commands import ShardInventory, UpdateEvent
+from events.service_layer.handlers import InsufficientTickets, InvalidId
+from events.service_layer.messagebus import MessageBus
+from tests.conftest import select_outbox_events
+
+pytestmark = pytest.mark.integration
+
+
+async def select_shards(bus: MessageBus, event_id: int) -> list[int]:
+    async with bus.uow as uow:
+        result = await uow.session.execute(
+            select(model.EventInventoryShard.available_tickets)
+            .where(model.EventInventoryShard.event_id == event_id)
+            .order_by(model.EventInventoryShard.shard)
+        )
+        return list(result.scalars())
+
+
+@pytest.fixture
+async def sharded_event(bus: MessageBus, sqlite_fake_events: list[model.Event]) -> model.Event:
+    event = sqlite_fake_events[-1]
+    await bus.handle(ShardInventory(id=event.id, shards=4))
+    return event
+
+
+async def test_tickets_are_split_across_shards_and_exposed_as_sum(bus: MessageBus, sharded_event: model.Event):
+    assert await select_shards(bus, sharded_event.id) == [3, 3, 2, 2]
+
+    event = await views.event(bus.uow, sharded_event.id)
+    assert event.available_tickets == sharded_event.available_tickets
+
+
+async def test_can_sell_tickets_from_sharded_inventory(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=1))
+
+    assert sum(await select_shards(bus, sharded_event.id)) == sharded_event.available_tickets - 1
+    assert (await views.event(bus.uow, sharded_event.id)).available_tickets == sharded_event.available_tickets - 1
+    assert await select_outbox_events(bus.uow) == [
+        events.AvailableTicketsDecreased(
+            event_id=sharded_event.id, remaining_tickets=sharded_event.available_tickets - 1
+        )
+    ]
+
+
+async def test_shards_are_rebalanced_when_no_shard_covers_the_sale(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=7))
+
+    assert await select_shards(bus, sharded_event.id) == [1, 1, 1, 0]
+    assert (await views.event(bus.uow, sharded_event.id)).available_tickets == 3
+
+
+async def test_shards_are_rebalanced_when_a_shard_empties(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=2))
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=2))
+
+    shards = await select_shards(bus, sharded_event.id)
+    assert sum(shards) == sharded_event.available_tickets - 4
+    assert max(shards) - min(shards) <= 1
+
+
+async def test_sales_and_rebalances_leave_event_row_alone(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=3))
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=5))
+
+    async with bus.uow as uow:
+        event_row_tickets = await uow.session.scalar(
+            select(model.Event.available_tickets).where(model.Event.id == sharded_event.id)
+        )
+    assert event_row_tickets == sharded_event.available_tickets
+    assert sum(await select_shards(bus, sharded_event.id)) == sharded_event.available_tickets - 8
+
+
+async def test_cant_sell_more_tickets_than_all_shards_have(bus: MessageBus, sharded_event: model.Event):
+    with pytest.raises(InsufficientTickets):
+        await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=11))
+
+    assert await select_shards(bus, sharded_event.id) == [3, 3, 2, 2]
+
+
+async def test_sold_out_sharded_event_is_not_listed(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=10))
+
+    listed_ids = [
+        event.id for event in await views.events(bus.uow, datetime_from=None, datetime_to=None, items_count=100)
+    ]
+    assert sharded_event.id not in listed_ids
+
+
+async def test_update_available_tickets_redistributes_shards(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(UpdateEvent(id=sharded_event.id, available_tickets=20))
+
+    assert await select_shards(bus, sharded_event.id) == [5, 5, 5, 5]
+    assert (await views.event(bus.uow, sharded_event.id)).available_tickets == 20
+
+
+async def test_updated_sharded_event_reports_shard_sum(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=3))
+
+    updated = await bus.handle(UpdateEvent(id=sharded_event.id, ticket_price=sharded_event.ticket_price + 1))
+
+    assert updated.available_tickets == sharded_event.available_tickets - 3
+
+
+async def test_single_shard_moves_tickets_back_to_event(bus: MessageBus, sharded_event: model.Event):
+    await bus.handle(events.TicketsSold(event_id=sharded_event.id, tickets_count=1))
+    await bus.handle(ShardInventory(id=sharded_event.id, shards=1))
+
+    assert await select_shards(bus, sharded_event.id) == []
+    assert (await views.event(bus.uow, sharded_event.id)).available_tickets == sharded_event.available_tickets - 1
+
+
+async def test_cant_shard_non_existent_event(bus: MessageBus):
+    with pytest.raises(InvalidId, match='Invalid id 9999'):
+        await bus.handle(ShardInventory(id=9999, shards=4))
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from events.adapters.ledger import ProcessedMessage
+from events.domain import events, model
+from events.domain.commands import SellTickets
+from events.entrypoints.eventconsumer import LedgerExpiry
+from events.service_layer.handlers import InsufficientTickets
+from events.service_layer.messagebus import MessageBus
+
+pytestmark = pytest.mark.integration
+
+
+async def available_tickets(bus: MessageBus, event_id: int) -> int:
+    async with bus.uow as uow:
+        event = await uow.session.get(model.Event, event_id)
+        return event.available_tickets  # type: ignore
+
+
+async def count_ledger(bus: MessageBus) -> int:
+    async with bus.uow as uow:
+        return await uow.session.scalar(select(func.count()).select_from(ProcessedMessage))  # type: ignore
+
+
+async def test_redelivered_message_is_applied_once(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+    sale = events.TicketsSold(event_id=event.id, tickets_count=2, message_id='message-1')
+
+    await bus.handle(sale)
+    await bus.handle(sale)
+
+    assert await available_tickets(bus, event.id) == event.available_tickets - 2
+    assert await count_ledger(bus) == 1
+
+
+async def test_messages_without_id_are_not_deduplicated(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+    sale = events.TicketsSold(event_id=event.id, tickets_count=2)
+
+    await bus.handle(sale)
+    await bus.handle(sale)
+
+    assert await available_tickets(bus, event.id) == event.available_tickets - 4
+    assert await count_ledger(bus) == 0
+
+
+async def test_batch_skips_recorded_and_repeated_messages(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+    await bus.handle(events.TicketsSold(event_id=event.id, tickets_count=1, message_id='message-1'))
+
+    await bus.handle(
+        SellTickets(
+            sales=[
+                events.TicketsSold(event_id=event.id, tickets_count=1, message_id='message-1'),
+                events.TicketsSold(event_id=event.id, tickets_count=2, message_id='message-2'),
+                events.TicketsSold(event_id=event.id, tickets_count=2, message_id='message-2'),
+                events.TicketsSold(event_id=event.id, tickets_count=3),
+            ]
+        )
+    )
+
+    assert await available_tickets(bus, event.id) == event.available_tickets - 6
+    assert await count_ledger(bus) == 2
+
+
+async def test_failed_message_is_not_recorded(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+    too_many = events.TicketsSold(event_id=event.id, tickets_count=event.available_tickets + 1, message_id='message-1')
+
+    with pytest.raises(InsufficientTickets):
+        await bus.handle(too_many)
+
+    assert await count_ledger(bus) == 0
+
+
+async def test_expiry_deletes_old_ledger_rows_in_batches(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+    for index in range(5):
+        await bus.handle(events.TicketsSold(event_id=event.id, tickets_count=1, message_id=f'message-{index}'))
+
+    async with bus.uow as uow:
+        await uow.session.execute(
+            update(ProcessedMessage)
+            .where(ProcessedMessage.id != 'message-4')  # type: ignore
+            .values(processed_at=datetime.now() - timedelta(days=8))
+        )
+        await uow.commit()
+
+    expiry = LedgerExpiry(bus.uow, retention=timedelta(days=7).total_seconds(), batch_size=3)
+
+    assert await expiry.expire_batch() == 3
+    assert await expiry.expire_batch() == 1
+    assert await expiry.expire_batch() == 0
+    assert await count_ledger(bus) == 1
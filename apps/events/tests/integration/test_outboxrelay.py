@@ -0,0 +1,128 @@
+import pytest
+from aiormq.exceptions import DeliveryError
+
+from events.adapters.eventpublisher import FakeEventPublisher, PublishError
+from events.adapters.outbox import SqlAlchemyOutbox
+from events.domain import events, model
+from events.domain.commands import DeleteEvent, UpdateEvent
+from events.entrypoints.outboxrelay import OutboxRelay
+from events.service_layer.messagebus import MessageBus
+from tests.conftest import select_outbox_events
+
+pytestmark = pytest.mark.integration
+
+
+async def test_events_are_written_to_outbox_in_handler_transaction(
+    bus: MessageBus, sqlite_fake_events: list[model.Event]
+):
+    event = sqlite_fake_events[-1]
+
+    await bus.handle(DeleteEvent(id=event.id))
+
+    assert await select_outbox_events(bus.uow) == [events.Deleted(event_id=event.id)]
+
+
+async def test_outbox_is_empty_when_handler_fails(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+
+    with pytest.raises(ValueError, match='Simulated error'):  # noqa: PT012
+        async with bus.uow as uow:
+            uow.outbox.add(events.Deleted(event_id=event.id))
+            raise ValueError('Simulated error')
+
+    assert await select_outbox_events(bus.uow) == []
+
+
+async def test_relay_publishes_and_drains_outbox_in_batches(
+    bus: MessageBus, sqlite_fake_events: list[model.Event], fake_publisher: FakeEventPublisher
+):
+    for event in sqlite_fake_events[-3:]:
+        await bus.handle(UpdateEvent(id=event.id, ticket_price=event.ticket_price + 1))
+
+    relay = OutboxRelay(bus.uow, fake_publisher, batch_size=2)
+
+    assert await relay.relay_batch() == 2
+    assert await relay.relay_batch() == 1
+    assert await relay.relay_batch() == 0
+
+    assert [message.model_copy(update={'message_id': None}) for message in fake_publisher.messages] == [
+        events.TicketPriceChanged(event_id=event.id, new_price=event.ticket_price + 1)
+        for event in sqlite_fake_events[-3:]
+    ]
+    assert await select_outbox_events(bus.uow) == []
+
+
+async def test_relay_keeps_outbox_messages_when_publish_fails(
+    bus: MessageBus, sqlite_fake_events: list[model.Event], fake_publisher: FakeEventPublisher
+):
+    event = sqlite_fake_events[-1]
+    await bus.handle(DeleteEvent(id=event.id))
+
+    async def failing_send_events(batch):
+        raise ConnectionError('Broker is unavailable')
+
+    fake_publisher.send_events = failing_send_events  # type: ignore
+
+    with pytest.raises(ConnectionError):
+        await OutboxRelay(bus.uow, fake_publisher).relay_batch()
+
+    assert await select_outbox_events(bus.uow) == [events.Deleted(event_id=event.id)]
+
+
+async def test_relay_retries_publish_with_the_same_message_ids(
+    bus: MessageBus, sqlite_fake_events: list[model.Event], fake_publisher: FakeEventPublisher
+):
+    for event in sqlite_fake_events[-2:]:
+        await bus.handle(DeleteEvent(id=event.id))
+
+    attempts = []
+
+    async def failing_send_events(batch):
+        attempts.append([event.message_id for event in batch])
+        raise ConnectionError('Broker is unavailable')
+
+    fake_publisher.send_events = failing_send_events  # type: ignore
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await OutboxRelay(bus.uow, fake_publisher).relay_batch()
+
+    assert attempts[0] == attempts[1]
+    assert len(set(attempts[0])) == 2
+    assert None not in attempts[0]
+
+
+async def test_relay_keeps_messages_from_the_first_unconfirmed_one(
+    bus: MessageBus, sqlite_fake_events: list[model.Event], fake_publisher: FakeEventPublisher
+):
+    for event in sqlite_fake_events[-3:]:
+        await bus.handle(DeleteEvent(id=event.id))
+
+    async def partially_confirmed_send_events(batch):
+        raise PublishError({1: DeliveryError(None, None)})  # type: ignore
+
+    fake_publisher.send_events = partially_confirmed_send_events  # type: ignore
+
+    assert await OutboxRelay(bus.uow, fake_publisher).relay_batch() == 1
+    assert await select_outbox_events(bus.uow) == [
+        events.Deleted(event_id=event.id) for event in sqlite_fake_events[-2:]
+    ]
+
+
+async def test_relay_skips_batch_while_another_relay_holds_the_outbox(
+    bus: MessageBus,
+    sqlite_fake_events: list[model.Event],
+    fake_publisher: FakeEventPublisher,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    event = sqlite_fake_events[-1]
+    await bus.handle(DeleteEvent(id=event.id))
+
+    async def claimed_elsewhere(self) -> bool:
+        return False
+
+    monkeypatch.setattr(SqlAlchemyOutbox, 'claim', claimed_elsewhere)
+
+    assert await OutboxRelay(bus.uow, fake_publisher).relay_batch() == 0
+    assert fake_publisher.messages == []
+    assert await select_outbox_events(bus.uow) == [events.Deleted(event_id=event.id)]
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+
+from events import metrics, views
+from events.domain import model
+from events.domain.commands import DeleteEvent, UpdateEvent
+from events.domain.events import TicketsSold
+from events.service_layer.messagebus import MessageBus
+from events.service_layer.unit_of_work import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+async def test_cursor_pages_walk_the_same_events_as_offset_pages(
+    uow: SqlAlchemyUnitOfWork, sqlite_fake_events: list[model.Event]
+):
+    all_events = await views.events(uow, datetime_from=None, datetime_to=None, items_count=100)
+
+    walked, after = [], None
+    while page := await views.events(uow, datetime_from=None, datetime_to=None, items_count=3, after=after):
+        walked.extend(page)
+        after = (page[-1].event_datetime, page[-1].id)
+
+    assert [event.id for event in walked] == [event.id for event in all_events]
+
+
+async def test_event_is_served_from_cache_until_invalidated(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[0]
+
+    first = await views.event(bus.uow, event.id)  # type: ignore
+    views.cache.hits = 0
+    assert await views.event(bus.uow, event.id) is first  # type: ignore
+    assert views.cache.hits == 1
+
+    await bus.handle(UpdateEvent(id=event.id, ticket_price=event.ticket_price + 1))
+
+    updated = await views.event(bus.uow, event.id)  # type: ignore
+    assert updated.ticket_price == event.ticket_price + 1  # type: ignore
+
+
+async def test_sold_tickets_and_deletion_invalidate_cached_event(
+    bus: MessageBus, sqlite_fake_events: list[model.Event]
+):
+    event = sqlite_fake_events[-1]
+    await views.event(bus.uow, event.id)  # type: ignore
+
+    await bus.handle(TicketsSold(event_id=event.id, tickets_count=1))  # type: ignore
+    cached = await views.event(bus.uow, event.id)  # type: ignore
+    assert cached.available_tickets == event.available_tickets - 1  # type: ignore
+
+    await bus.handle(DeleteEvent(id=event.id))
+    cached = await views.event(bus.uow, event.id)  # type: ignore
+    assert cached.deleted_at is not None  # type: ignore
+
+
+async def test_cache_hits_and_misses_are_exposed_as_metrics(uow: SqlAlchemyUnitOfWork, sqlite_fake_events):
+    before = metrics.snapshot()
+
+    await views.event(uow, sqlite_fake_events[0].id)
+    await views.event(uow, sqlite_fake_events[0].id)
+
+    after = metrics.snapshot()
+    assert after['event_cache_misses'] - before['event_cache_misses'] == 1
+    assert after['event_cache_hits'] - before['event_cache_hits'] == 1
+
+
+async def test_soft_deleted_events_are_not_listed(bus: MessageBus, sqlite_fake_events: list[model.Event]):
+    event = sqlite_fake_events[-1]
+
+    await bus.handle(DeleteEvent(id=event.id))
+
+    listed = await views.events(bus.uow, datetime_from=None, datetime_to=None, items_count=100)
+    assert event.id not in [listed_event.id for listed_event in listed]
+
+
+async def test_stream_events_yields_listed_events_in_batches(
+    uow: SqlAlchemyUnitOfWork, sqlite_fake_events: list[model.Event]
+):
+    now = datetime.now()
+    listed = await views.events(uow, datetime_from=now, datetime_to=None, items_count=100)
+
+    batches = [batch async for batch in views.stream_events(uow, now, batch_size=4)]
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [event.model_dump(exclude={'deleted_at'}) for batch in batches for event in batch] == [
+        event.model_dump(exclude={'deleted_at'}) for event in listed
+    ]
@@ -0,0 +1,52 @@
+import pytest
+
+from events.adapters import cache as cache_module
+from events.adapters.cache import TTLCache
+
+pytestmark = pytest.mark.unit
+
+
+def test_hits_and_misses_are_counted():
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    assert cache.get(1) is None
+    cache.set(1, 'event')
+    assert cache.get(1) == 'event'
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set(1, 'first')
+    cache.set(2, 'second')
+    cache.get(1)
+    cache.set(3, 'third')
+
+    assert len(cache) == 2
+    assert cache.get(2) is None
+    assert cache.get(1) == 'first'
+    assert cache.get(3) == 'third'
+
+
+def test_expired_entry_is_a_miss(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr(cache_module, 'monotonic', lambda: now)
+    cache = TTLCache(maxsize=10, ttl=5)
+
+    cache.set(1, 'event')
+    now += 6
+
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_deleted_entry_is_a_miss():
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    cache.set(1, 'event')
+    cache.delete(1)
+    cache.delete(2)
+
+    assert cache.get(1) is None
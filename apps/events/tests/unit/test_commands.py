@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 import pytest
 from pydantic import ValidationError
 
-from events.domain.commands import CreateEvent, UpdateEvent
+from events.domain.commands import CreateEvent, UpdateEvent, UpdateEvents
 
 pytestmark = pytest.mark.unit
 
@@ -63,3 +63,8 @@ def test_cant_update_event_with_bad_available_tickets_value(fake_event, bad_avai
 def test_cant_update_event_without_all_fields():
     with pytest.raises(ValidationError, match='At least one field must be provided for update'):
         UpdateEvent(id=1)
+
+
+def test_cant_update_same_event_twice_in_one_batch():
+    with pytest.raises(ValidationError, match='only once per batch'):
+        UpdateEvents(events=[UpdateEvent(id=1, name='first'), UpdateEvent(id=1, name='second')])
@@ -0,0 +1,59 @@
+import pytest
+
+from events import metrics
+from events.domain import events
+from events.entrypoints.eventconsumer import RabbitMQEventConsumer
+from tests.conftest import FakeIncomingMessage
+
+pytestmark = pytest.mark.unit
+
+
+class FakeBus:
+    def __init__(self, handled: list):
+        self.handled = handled
+
+    async def handle(self, event):
+        self.handled.append(event)
+
+
+@pytest.fixture
+def handled() -> list:
+    return []
+
+
+@pytest.fixture
+def consumer(handled: list) -> RabbitMQEventConsumer:
+    return RabbitMQEventConsumer(lambda: FakeBus(handled), 'amqp://unused', dedup_size=10)  # type: ignore
+
+
+async def test_message_id_is_passed_to_handler(consumer: RabbitMQEventConsumer, handled: list):
+    await consumer.on_message(FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), 'message-1'))  # type: ignore
+
+    assert handled[0].message_id == 'message-1'
+
+
+async def test_recently_processed_message_is_acked_without_handling(consumer: RabbitMQEventConsumer, handled: list):
+    duplicates = metrics.snapshot().get('consumer_duplicates', 0)
+    first = FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), 'message-1')
+    redelivered = FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), 'message-1')
+
+    await consumer.on_message(first)  # type: ignore
+    await consumer.on_message(redelivered)  # type: ignore
+
+    assert len(handled) == 1
+    assert redelivered.acked
+    assert metrics.snapshot()['consumer_duplicates'] == duplicates + 1
+
+
+async def test_messages_without_id_are_always_handled(consumer: RabbitMQEventConsumer, handled: list):
+    for _ in range(2):
+        await consumer.on_message(FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), None))  # type: ignore
+
+    assert len(handled) == 2
+
+
+async def test_filter_is_bounded(consumer: RabbitMQEventConsumer):
+    for index in range(20):
+        await consumer.on_message(FakeIncomingMessage(events.Deleted(event_id=index), f'message-{index}'))  # type: ignore
+
+    assert len(consumer.recent) == 10  # type: ignore
@@ -0,0 +1,90 @@
+import pytest
+
+from events.domain import events
+from events.entrypoints.eventconsumer import RabbitMQEventConsumer
+from events.service_layer.handlers import InsufficientTickets, InvalidId
+from tests.conftest import FakeChannel, FakeIncomingMessage
+
+pytestmark = pytest.mark.unit
+
+
+class FailingBus:
+    async def handle(self, event):
+        raise RuntimeError('Handler is broken')
+
+
+@pytest.fixture
+def channel() -> FakeChannel:
+    return FakeChannel()
+
+
+@pytest.fixture
+def consumer(channel: FakeChannel) -> RabbitMQEventConsumer:
+    consumer = RabbitMQEventConsumer(FailingBus, 'amqp://unused', max_attempts=4, retry_delay_ms=100)  # type: ignore
+    consumer._channel = channel  # type: ignore
+    return consumer
+
+
+def test_retry_delays_grow_exponentially(consumer: RabbitMQEventConsumer):
+    assert consumer.retry_delays == [100, 200, 400]
+
+
+@pytest.mark.parametrize(
+    ('previous_attempts', 'routing_key'),
+    [(0, 'orders.retry.100ms'), (1, 'orders.retry.200ms'), (2, 'orders.retry.400ms'), (3, 'orders.dlq')],
+)
+async def test_failed_message_is_retried_with_backoff_then_dead_lettered(
+    consumer: RabbitMQEventConsumer, channel: FakeChannel, previous_attempts: int, routing_key: str
+):
+    headers = {'x-attempt': previous_attempts} if previous_attempts else {}
+    message = FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), 'message-1', headers)
+
+    with pytest.raises(RuntimeError):
+        await consumer.on_message(message)  # type: ignore
+
+    [(published_to, published)] = channel.published
+    assert published_to == routing_key
+    assert published.body == message.body
+    assert published.message_id == 'message-1'
+    assert published.headers['x-attempt'] == previous_attempts + 1
+    assert published.headers['x-last-error'] == "RuntimeError('Handler is broken')"
+    assert message.acked
+
+
+async def test_undecodable_message_is_dead_lettered_at_once(consumer: RabbitMQEventConsumer, channel: FakeChannel):
+    message = FakeIncomingMessage(events.Deleted(event_id=1))
+    message.body = b'{"name": "TicketsSold"}'
+
+    with pytest.raises(ValueError, match='validation error'):
+        await consumer.on_message(message)  # type: ignore
+
+    assert [routing_key for routing_key, _ in channel.published] == ['orders.dlq']
+    assert message.acked
+
+
+@pytest.mark.parametrize('error', [InvalidId('Invalid id 1'), InsufficientTickets('Not enough tickets')])
+async def test_domain_rejection_is_dead_lettered_at_once(
+    consumer: RabbitMQEventConsumer, channel: FakeChannel, error: Exception
+):
+    class RejectingBus:
+        async def handle(self, event):
+            raise error
+
+    consumer.bus_factory = RejectingBus  # type: ignore
+    message = FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), 'message-1')
+
+    with pytest.raises(type(error)):
+        await consumer.on_message(message)  # type: ignore
+
+    assert [routing_key for routing_key, _ in channel.published] == ['orders.dlq']
+    assert channel.published[0][1].headers['x-attempt'] == 1
+    assert message.acked
+
+
+async def test_failed_message_is_not_remembered_as_processed(consumer: RabbitMQEventConsumer):
+    message = FakeIncomingMessage(events.TicketsSold(event_id=1, tickets_count=1), 'message-1')
+
+    with pytest.raises(RuntimeError):
+        await consumer.on_message(message)  # type: ignore
+
+    assert not consumer.is_duplicate(message)  # type: ignore
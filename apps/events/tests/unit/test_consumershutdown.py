@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from events.domain import events
+from events.entrypoints.eventconsumer import RabbitMQEventConsumer, parse_args
+from tests.conftest import FakeIncomingMessage
+
+pytestmark = pytest.mark.unit
+
+
+class SlowBus:
+    def __init__(self, handled: list):
+        self.handled = handled
+
+    async def handle(self, event):
+        await asyncio.sleep(0.05)
+        self.handled.append(event)
+
+
+async def test_drain_waits_for_in_flight_messages():
+    handled = []
+    consumer = RabbitMQEventConsumer(lambda: SlowBus(handled), 'amqp://unused')  # type: ignore
+    messages = [FakeIncomingMessage(events.Deleted(event_id=event_id)) for event_id in range(3)]
+
+    for message in messages:
+        asyncio.create_task(consumer.on_message(message))  # type: ignore
+    await asyncio.sleep(0)
+
+    await consumer.drain()
+
+    assert [event.event_id for event in handled] == [0, 1, 2]
+    assert all(message.acked for message in messages)
+
+
+async def test_drain_gives_up_after_timeout():
+    consumer = RabbitMQEventConsumer(lambda: SlowBus([]), 'amqp://unused', drain_timeout=0.01)  # type: ignore
+    task = asyncio.create_task(consumer.on_message(FakeIncomingMessage(events.Deleted(event_id=1))))  # type: ignore
+    await asyncio.sleep(0)
+
+    await consumer.drain()
+
+    assert not task.done()
+    await task
+
+
+def test_workers_option_defaults_to_one():
+    assert parse_args([]).workers == 1
+    assert parse_args(['--workers', '4']).workers == 4
+
+
+def test_workers_option_must_be_positive():
+    with pytest.raises(SystemExit):
+        parse_args(['--workers', '0'])
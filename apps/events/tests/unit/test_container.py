@@ -0,0 +1,37 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from events.entrypoints.fastapi.dependencies.bus import bus, publish
+from events.entrypoints.fastapi.dependencies.container import Container, create_container
+from events.service_layer.messagebus import MessageBus
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def container() -> Container:
+    return create_container()
+
+
+@pytest.fixture
+def client(container: Container) -> TestClient:
+    app = FastAPI()
+    app.state.container = container
+
+    @app.get('/')
+    async def index(
+        bus: Annotated[MessageBus, Depends(bus)], publisher: Annotated[object, Depends(publish)]
+    ) -> dict[str, int]:
+        return {'session_factory': id(bus.uow.session_factory), 'publisher': id(publisher)}  # type: ignore
+
+    return TestClient(app)
+
+
+def test_dependencies_are_fetched_from_app_container(client: TestClient, container: Container):
+    first, second = client.get('/').json(), client.get('/').json()
+
+    assert first['session_factory'] == second['session_factory'] == id(container.session_factory)
+    assert first['publisher'] == second['publisher'] == id(container.publisher)
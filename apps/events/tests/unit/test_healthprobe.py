@@ -0,0 +1,54 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from events import metrics
+from events.entrypoints.healthprobe import HealthProbe
+
+pytestmark = pytest.mark.unit
+
+
+async def probe(port: int, path: bytes = b'/') -> bytes:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'GET %s HTTP/1.1\r\nHost: localhost\r\n\r\n' % path)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+@pytest.mark.parametrize(
+    ('healthy', 'status'), [(True, b'HTTP/1.1 200 OK'), (False, b'HTTP/1.1 503 Service Unavailable')]
+)
+async def test_probe_reports_check_result(healthy: bool, status: bytes):
+    async with HealthProbe(lambda: healthy, host='127.0.0.1', port=0) as health_probe:
+        response = await probe(health_probe.port)
+
+    assert response.startswith(status)
+
+
+async def test_probe_evaluates_check_on_every_request():
+    state = {'healthy': False}
+
+    async with HealthProbe(lambda: state['healthy'], host='127.0.0.1', port=0) as health_probe:
+        before = await probe(health_probe.port)
+        state['healthy'] = True
+        after = await probe(health_probe.port)
+
+    assert before.endswith(b'unavailable')
+    assert after.endswith(b'ok')
+
+
+async def test_probe_serves_worker_metrics():
+    metrics.inc('consumer_retries')
+
+    async with HealthProbe(lambda: False, host='127.0.0.1', port=0) as health_probe:
+        response = await probe(health_probe.port, b'/metrics')
+
+    headers, body = response.split(b'\r\n\r\n', 1)
+    assert headers.startswith(b'HTTP/1.1 200 OK')
+    assert b'Content-Type: application/json' in headers
+    assert json.loads(body)['pid'] == os.getpid()
+    assert json.loads(body)['consumer_retries'] >= 1
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from events.entrypoints.eventconsumer import MicroBatcher
+
+pytestmark = pytest.mark.unit
+
+
+async def test_flushes_when_batch_is_full():
+    batches = []
+
+    async def flush(items):
+        batches.append(items)
+
+    batcher = MicroBatcher(flush, max_size=3, max_delay=10)
+    for item in range(7):
+        batcher.add(item)
+
+    await asyncio.sleep(0)
+
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+
+    await batcher.stop()
+    assert batches[-1] == [6]
+
+
+async def test_flushes_partial_batch_after_max_delay():
+    batches = []
+
+    async def flush(items):
+        batches.append(items)
+
+    batcher = MicroBatcher(flush, max_size=100, max_delay=0.01)
+    batcher.add(1)
+    batcher.add(2)
+
+    await asyncio.sleep(0.05)
+
+    assert batches == [[1, 2]]
+    await batcher.stop()
+    assert batches == [[1, 2]]
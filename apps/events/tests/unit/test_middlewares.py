@@ -0,0 +1,76 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from events.entrypoints.fastapi.middlewares import LogRequestsMiddleware
+from events.logger import logger
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def logs():
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record), level='INFO')
+    yield records
+    logger.remove(handler_id)
+
+
+def create_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(LogRequestsMiddleware, **options)
+
+    @app.post('/echo')
+    async def echo(request: Request) -> dict:
+        return {'size': len(await request.body())}
+
+    @app.get('/fail')
+    async def fail():
+        raise ValueError('Simulated error')
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_successful_request_is_logged_without_headers_and_body(logs):
+    client = create_client(body_sample_rate=0)
+
+    response = client.post('/echo?x=1', content=b'payload')
+
+    assert response.json() == {'size': 7}
+    assert len(logs) == 1
+    log_data = logs[0]['message']
+    assert "'status_code': 200" in log_data
+    assert "'query_string': 'x=1'" in log_data
+    assert 'payload' not in log_data
+    assert 'headers' not in log_data
+
+
+def test_sampled_request_is_logged_with_body_and_redacted_authorization(logs):
+    client = create_client(body_sample_rate=1)
+
+    client.post('/echo', content=b'payload', headers={'Authorization': 'Bearer secret'})
+
+    log_data = logs[0]['message']
+    assert "b'payload'" in log_data
+    assert "'authorization': '[REDACTED]'" in log_data
+    assert 'secret' not in log_data
+
+
+def test_failed_request_is_logged_as_error_with_body(logs):
+    client = create_client(body_sample_rate=0)
+
+    response = client.get('/fail')
+
+    assert response.status_code == 500
+    assert logs[0]['level'].name == 'ERROR'
+    assert "'error': 'Simulated error'" in logs[0]['message']
+    assert "'body': b''" in logs[0]['message']
+
+
+def test_captured_body_is_truncated(logs):
+    client = create_client(body_sample_rate=1, body_max_size=4)
+
+    response = client.post('/echo', content=b'payload')
+
+    assert response.json() == {'size': 7}
+    assert "'body': b'payl'" in logs[0]['message']
@@ -0,0 +1,79 @@
+import asyncio
+import random
+
+import pytest
+
+from events import metrics
+from events.entrypoints.eventconsumer import PartitionedLanes
+
+pytestmark = pytest.mark.unit
+
+
+def test_same_key_always_maps_to_same_lane():
+    lanes = PartitionedLanes(4)
+
+    assert lanes.lane_for(5) == lanes.lane_for(5) == 1
+    assert {lanes.lane_for(key) for key in range(100)} == {0, 1, 2, 3}
+
+
+async def test_jobs_with_same_key_are_processed_in_submission_order():
+    lanes = PartitionedLanes(3)
+    processed: dict[int, list[int]] = {event_id: [] for event_id in range(6)}
+
+    def job(event_id: int, seq: int):
+        async def run():
+            await asyncio.sleep(random.random() / 100)
+            processed[event_id].append(seq)
+
+        return run
+
+    for seq in range(10):
+        for event_id in range(6):
+            lanes.submit(event_id, job(event_id, seq))
+
+    lanes.start()
+    await asyncio.gather(*(queue.join() for queue in lanes.queues))
+    await lanes.stop()
+
+    assert all(sequence == list(range(10)) for sequence in processed.values())
+
+
+async def test_lane_depths_are_exposed_as_metrics():
+    lanes = PartitionedLanes(2, name='test')
+
+    async def noop():
+        pass
+
+    lanes.submit(0, noop)
+    lanes.submit(2, noop)
+    lanes.submit(1, noop)
+
+    assert lanes.depths() == [2, 1]
+
+    lanes.start()
+    assert metrics.snapshot()['test_lane_0_depth'] == 2
+
+    await asyncio.gather(*(queue.join() for queue in lanes.queues))
+    await lanes.stop()
+
+    assert 'test_lane_0_depth' not in metrics.snapshot()
+
+
+async def test_failed_job_does_not_stop_lane():
+    lanes = PartitionedLanes(1)
+    processed = []
+
+    async def failing():
+        raise ValueError('Simulated error')
+
+    async def succeeding():
+        processed.append(True)
+
+    lanes.submit(1, failing)
+    lanes.submit(1, succeeding)
+
+    lanes.start()
+    await lanes.queues[0].join()
+    await lanes.stop()
+
+    assert processed == [True]
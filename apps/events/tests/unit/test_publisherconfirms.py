@@ -0,0 +1,70 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from aiormq.exceptions import DeliveryError
+
+from events.adapters.eventpublisher import PublishError, RabbitMQEventPublisher
+from events.domain import events
+
+pytestmark = pytest.mark.unit
+
+
+class FakeExchange:
+    def __init__(self, nacked: set[int]):
+        self.nacked = nacked
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.published: list[bytes] = []
+
+    async def publish(self, message, routing_key, **kwargs):
+        self.outstanding += 1
+        self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        await asyncio.sleep(0)
+        self.outstanding -= 1
+
+        if events.Deleted.model_validate_json(message.body).event_id in self.nacked:
+            raise DeliveryError(None, None)  # type: ignore
+        self.published.append(message.body)
+
+
+@pytest.fixture
+def exchange() -> FakeExchange:
+    return FakeExchange(nacked={3, 7})
+
+
+@pytest.fixture
+def publisher(exchange: FakeExchange) -> RabbitMQEventPublisher:
+    publisher = RabbitMQEventPublisher('amqp://unused', confirm_window=4)
+
+    class FakeChannel:
+        default_exchange = exchange
+
+    @asynccontextmanager
+    async def connect():
+        yield FakeChannel()
+
+    publisher.connect = connect  # type: ignore
+    return publisher
+
+
+async def test_publishes_are_pipelined_within_a_confirm_window(
+    publisher: RabbitMQEventPublisher, exchange: FakeExchange
+):
+    exchange.nacked.clear()
+
+    await publisher.send_events([events.Deleted(event_id=event_id) for event_id in range(10)])
+
+    assert exchange.max_outstanding == 4
+    assert len(exchange.published) == 10
+
+
+async def test_unconfirmed_publishes_are_reported_by_batch_index(
+    publisher: RabbitMQEventPublisher, exchange: FakeExchange
+):
+    with pytest.raises(PublishError, match='2 events were not confirmed') as error:
+        await publisher.send_events([events.Deleted(event_id=event_id) for event_id in range(10)])
+
+    assert set(error.value.failed) == {3, 7}
+    assert all(isinstance(failure, DeliveryError) for failure in error.value.failed.values())
+    assert len(exchange.published) == 8
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy.orm import configure_mappers
+
+from events.domain.model import Event
+from events.entrypoints.fastapi.responses import EventResponse
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def events() -> list[Event]:
+    configure_mappers()
+    return [
+        Event.model_construct(
+            id=i,
+            name=f'Концерт "{i}" ☂',
+            description='Line\nbreak',
+            event_datetime=datetime(2030, 1, 2, 3, 4, 5, 678) + timedelta(hours=i),
+            available_tickets=i,
+            ticket_price=Decimal('3000.15') + i,
+            deleted_at=datetime(2029, 12, 31, 23, 59, 59) if i % 2 else None,
+        )
+        for i in range(1, 6)
+    ]
+
+
+async def render_with_fastapi(response_type, content) -> bytes:
+    field = create_model_field(name='Response', type_=response_type, mode='serialization')
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def test_event_list_is_byte_identical_to_fastapi_path(events: list[Event]):
+    assert EventResponse(events).body == await render_with_fastapi(list[Event], events)
+
+
+async def test_single_event_is_byte_identical_to_fastapi_path(events: list[Event]):
+    event = events[0].model_copy(update={'ticket_price': Decimal('0.125')})
+
+    assert EventResponse(event).body == await render_with_fastapi(Event, event)
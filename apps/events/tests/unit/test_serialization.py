@@ -0,0 +1,123 @@
+from decimal import Decimal
+
+import msgpack
+import pytest
+from pydantic import ValidationError
+
+from events.adapters.eventpublisher import RabbitMQEventPublisher
+from events.adapters.serialization import JSON, MSGPACK, registry
+from events.domain import events
+from events.logger import logger
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    'event',
+    [
+        events.TicketPriceChanged(event_id=1, new_price=Decimal('10.50')),
+        events.AvailableTicketsDecreased(event_id=2, remaining_tickets=3),
+        events.TicketsSold(event_id=3, tickets_count=4),
+        events.Deleted(event_id=4),
+    ],
+)
+def test_decodes_every_registered_event(event: events.Event):
+    assert registry.decode(event.model_dump_json().encode()) == event
+
+
+def test_name_may_come_after_payload_fields():
+    body = b'{"event_id": 1, "tickets_count": 2, "name": "TicketsSold"}'
+
+    assert registry.decode(body) == events.TicketsSold(event_id=1, tickets_count=2)
+
+
+def test_unknown_event_type_is_logged_and_skipped():
+    messages = []
+    handler_id = logger.add(messages.append, level='ERROR')
+
+    try:
+        assert registry.decode(b'{"name": "TicketsRefunded", "event_id": 1}') is None
+    finally:
+        logger.remove(handler_id)
+
+    assert 'Unknown event type: TicketsRefunded' in messages[0]
+
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        b'{"event_id": 1}',
+        b'{"name": "TicketsSold", "event_id": 1}',
+        b'{"name": "TicketPriceChanged", "event_id": 1, "new_price": "1.001"}',
+        b'not json',
+    ],
+)
+def test_invalid_messages_raise(body: bytes):
+    with pytest.raises(ValidationError):
+        registry.decode(body)
+
+
+ALL_EVENTS = [
+    events.TicketPriceChanged(event_id=1, new_price=Decimal('10.50')),
+    events.AvailableTicketsDecreased(event_id=2, remaining_tickets=0),
+    events.TicketsSold(event_id=3, tickets_count=4),
+    events.Deleted(event_id=4),
+]
+
+
+@pytest.mark.parametrize('event', ALL_EVENTS, ids=lambda event: event.name)
+@pytest.mark.parametrize(
+    ('encoded_as', 'decoded_as'),
+    [(JSON, JSON), (JSON, None), (MSGPACK, MSGPACK)],
+    ids=['json', 'json-without-content-type', 'msgpack'],
+)
+def test_compatibility_matrix(event: events.Event, encoded_as: str, decoded_as: str | None):
+    assert registry.decode(registry.encode(event, encoded_as), decoded_as) == event
+
+
+@pytest.mark.parametrize('event', ALL_EVENTS, ids=lambda event: event.name)
+def test_msgpack_payload_is_smaller_than_json(event: events.Event):
+    assert len(registry.encode(event, MSGPACK)) < len(registry.encode(event, JSON))
+
+
+def test_json_encoding_is_unchanged_for_existing_consumers():
+    event = events.TicketPriceChanged(event_id=1, new_price=Decimal('10.50'))
+
+    assert registry.encode(event, JSON) == event.model_dump_json().encode()
+
+
+def test_msgpack_message_is_validated():
+    with pytest.raises(ValidationError):
+        registry.decode(msgpack.packb(['TicketsSold', 1]), MSGPACK)
+
+
+def test_msgpack_message_is_positional_with_numeric_price():
+    event = events.TicketPriceChanged(event_id=1, new_price=Decimal('1500.50'))
+
+    assert msgpack.unpackb(registry.encode(event, MSGPACK)) == ['TicketPriceChanged', 1, 1500.5]
+
+
+@pytest.mark.parametrize('price', ['0.01', '0.30', '19.99', '1500.50', '99999999.99'])
+def test_msgpack_price_round_trips_exactly(price: str):
+    event = events.TicketPriceChanged(event_id=1, new_price=Decimal(price))
+
+    decoded = registry.decode(registry.encode(event, MSGPACK), MSGPACK)
+
+    assert decoded.new_price == Decimal(price)  # type: ignore
+
+
+def test_unknown_msgpack_event_type_is_skipped():
+    assert registry.decode(msgpack.packb(['TicketsRefunded', 1]), MSGPACK) is None
+
+
+def test_unsupported_content_type_is_rejected():
+    with pytest.raises(ValueError, match='Unsupported content type text/plain'):
+        registry.encode(events.Deleted(event_id=1), 'text/plain')
+
+    with pytest.raises(ValueError, match='Unsupported content type text/plain'):
+        registry.decode(b'Deleted 1', 'text/plain')
+
+
+def test_publisher_rejects_unsupported_content_type():
+    with pytest.raises(ValueError, match='Unsupported content type text/plain'):
+        RabbitMQEventPublisher('amqp://unused', content_type='text/plain')
@@ -0,0 +1,63 @@
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy.orm import configure_mappers
+
+from orders.domain.model import Order, OrderStatuses, Ticket
+from orders.entrypoints.fastapi.models import OrderPublic
+from orders.entrypoints.fastapi.responses import OrderResponse
+
+ITEMS = int(os.getenv('BENCH_ITEMS', '1000'))
+ROUNDS = int(os.getenv('BENCH_ROUNDS', '20'))
+
+field = create_model_field(name='Response_create_basket', type_=OrderPublic, mode='serialization')
+
+type Path = Callable[[list[Order]], Awaitable[list[bytes]]]
+
+
+async def pydantic_path(orders: list[Order]) -> list[bytes]:
+    return [JSONResponse(await serialize_response(field=field, response_content=order)).body for order in orders]
+
+
+async def precompiled_path(orders: list[Order]) -> list[bytes]:
+    return [OrderResponse(order).body for order in orders]
+
+
+async def measure(name: str, path: Path, orders: list[Order]) -> list[bytes]:
+    bodies = await path(orders)
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await path(orders)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    sys.stdout.write(f'{name:<12} {elapsed * 1000:8.2f} ms/list {elapsed / len(orders) * 1e6:8.2f} us/order\n')
+    return bodies
+
+
+async def main() -> None:
+    configure_mappers()
+    orders = [
+        Order(
+            id=i,
+            user_id='67f267cc870d069054169f05',
+            order_status=OrderStatuses.DONE,
+            tickets=[Ticket(id=3 * i + j, event_id=100 + j, order_id=i, price=100.5 + j) for j in range(3)],
+        )
+        for i in range(ITEMS)
+    ]
+
+    sys.stdout.write(f'{ITEMS} orders, {ROUNDS} rounds\n')
+    expected = await measure('pydantic', pydantic_path, orders)
+    actual = await measure('precompiled', precompiled_path, orders)
+    if actual != expected:
+        msg = 'Responses differ'
+        raise AssertionError(msg)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
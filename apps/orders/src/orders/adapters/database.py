@@ -0,0 +1,66 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from orders import metrics
+from orders.settings import (
+    POSTGRES_MAX_OVERFLOW,
+    POSTGRES_POOL_PRE_PING,
+    POSTGRES_POOL_RECYCLE,
+    POSTGRES_POOL_SIZE,
+    POSTGRES_POOL_TIMEOUT,
+    POSTGRES_STATEMENT_CACHE_SIZE,
+    POSTGRES_STATEMENT_TIMEOUT_MS,
+)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    @property
+    def metric_prefix(self) -> str:
+        return f'db_pool_{self.logging_name or "default"}'
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        start_time = time.perf_counter()
+        record = super()._create_connection()
+        # Handed to _do_get through the record so opening a connection is not counted as waiting for one
+        connect_seconds = record.info['connect_seconds'] = time.perf_counter() - start_time
+        metrics.inc(f'{self.metric_prefix}_connects')
+        metrics.inc(f'{self.metric_prefix}_connect_seconds', connect_seconds)
+        return record
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start_time = time.perf_counter()
+        connect_seconds = 0.0
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            metrics.inc(f'{self.metric_prefix}_checkout_timeouts')
+            raise
+        else:
+            connect_seconds = record.info.pop('connect_seconds', 0.0)
+            return record
+        finally:
+            wait_seconds = time.perf_counter() - start_time - connect_seconds
+            metrics.inc(f'{self.metric_prefix}_checkouts')
+            metrics.inc(f'{self.metric_prefix}_checkout_wait_seconds', wait_seconds)
+
+
+def create_engine(postgres_url: str, name: str = 'default') -> AsyncEngine:
+    engine = create_async_engine(
+        str(postgres_url),
+        poolclass=TimedQueuePool,
+        pool_size=POSTGRES_POOL_SIZE,
+        max_overflow=POSTGRES_MAX_OVERFLOW,
+        pool_timeout=POSTGRES_POOL_TIMEOUT,
+        pool_recycle=POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=POSTGRES_POOL_PRE_PING,
+        pool_logging_name=name,
+        connect_args={
+            'prepared_statement_cache_size': POSTGRES_STATEMENT_CACHE_SIZE,
+            'server_settings': {'statement_timeout': str(POSTGRES_STATEMENT_TIMEOUT_MS)},
+        },
+    )
+    metrics.gauge(f'db_pool_{name}_checked_out', lambda: engine.pool.checkedout())  # type: ignore
+    return engine
@@ -5,18 +5,19 @@ from functools import partial
 from orders.adapters.eventpublisher import AbstractEventPublisher
 from orders.service_layer import handlers, messagebus, unit_of_work
 
+type Handlers = dict[type, Callable]
+
 
 def bootstrap(
     uow: unit_of_work.AbstractUnitOfWork,
     publish: AbstractEventPublisher | None = None,
 ) -> messagebus.MessageBus:
-    dependencies = {'uow': uow, 'publish': publish}
+    return messagebus.MessageBus(uow=uow, handlers=bind_handlers(publish=publish))
 
-    injected_handlers = {
-        cmd_type: inject_dependencies(handler, dependencies) for cmd_type, handler in handlers.HANDLERS.items()
-    }
 
-    return messagebus.MessageBus(uow=uow, handlers=injected_handlers)
+def bind_handlers(publish: AbstractEventPublisher | None = None) -> Handlers:
+    dependencies = {'publish': publish}
+    return {cmd_type: inject_dependencies(handler, dependencies) for cmd_type, handler in handlers.HANDLERS.items()}
 
 
 def inject_dependencies(handler: Callable, dependencies: dict) -> Callable:
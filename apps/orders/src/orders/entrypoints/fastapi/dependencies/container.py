@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from orders.adapters.database import create_engine
+from orders.bootstrap import Handlers, bind_handlers
+from orders.settings import POSTGRES_URL
+
+
+@dataclass(frozen=True)
+class Container:
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    handlers: Handlers
+
+
+def create_container() -> Container:
+    engine = create_engine(POSTGRES_URL, name='api')
+    return Container(
+        engine=engine,
+        session_factory=async_sessionmaker(engine, expire_on_commit=False),
+        handlers=bind_handlers(),
+    )
@@ -1,21 +1,13 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel import SQLModel
 
-from orders.settings import POSTGRES_URL
-
-engine = create_async_engine(str(POSTGRES_URL), echo=False, future=True)
-
 
 @asynccontextmanager
-async def init_database() -> AsyncGenerator:
+async def init_database(engine: AsyncEngine) -> AsyncGenerator:
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
     await engine.dispose()
-
-
-async def session_factory() -> async_sessionmaker[AsyncSession]:
-    return async_sessionmaker(engine, expire_on_commit=False)
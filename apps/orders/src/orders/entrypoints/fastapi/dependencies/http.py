@@ -4,6 +4,7 @@ from fastapi import Depends, HTTPException
 from fastapi.security import APIKeyHeader
 
 user_id_header = APIKeyHeader(name='X-User-Id')
+user_role_header = APIKeyHeader(name='X-User-Role')
 
 
 async def user_id(user_id: str = Depends(user_id_header)) -> str:
@@ -13,3 +14,8 @@ async def user_id(user_id: str = Depends(user_id_header)) -> str:
 
 
 get_user_id = Annotated[str, Depends(user_id)]
+
+
+async def is_admin(user_role: str = Depends(user_role_header)) -> None:
+    if user_role != 'admin':
+        raise HTTPException(status_code=403, detail='You must have a admin role !')
@@ -2,29 +2,38 @@ from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
+from fastapi.responses import ORJSONResponse
 
+from orders.entrypoints.fastapi import metrics
+from orders.entrypoints.fastapi.dependencies.container import create_container
 from orders.entrypoints.fastapi.dependencies.db import init_database
 from orders.entrypoints.fastapi.exceptions import order_not_belong_user_handler, order_not_found_handler
-from orders.entrypoints.fastapi.middlewares import log_requests
+from orders.entrypoints.fastapi.middlewares import LogRequestsMiddleware
 from orders.entrypoints.fastapi.router import router
+from orders.logger import logger
 from orders.service_layer.handlers import OrderNotBelongUserError, OrderNotFoundError
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
-    async with init_database():
+async def lifespan(app: FastAPI) -> AsyncGenerator:
+    container = app.state.container = create_container()
+    async with init_database(container.engine):
         yield
+    # The sink is enqueued, so wait for the records still in flight before the process exits
+    await logger.complete()
 
 
 app = FastAPI(
     title='Orders service.',
     description='A service to manage orders and notify the events service about changes.',
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_exception_handler(OrderNotFoundError, order_not_found_handler)  # type: ignore
 app.add_exception_handler(OrderNotBelongUserError, order_not_belong_user_handler)  # type: ignore
 
-app.middleware('http')(log_requests)
+app.add_middleware(LogRequestsMiddleware)
 
 app.include_router(router)
+app.include_router(metrics.router)
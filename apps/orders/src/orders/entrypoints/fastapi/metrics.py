@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Depends
+
+from orders import metrics
+from orders.entrypoints.fastapi.dependencies.http import is_admin
+
+router = APIRouter(tags=['Metrics'], prefix='/metrics', dependencies=[Depends(is_admin)])
+
+
+@router.get('/')
+async def get_metrics() -> dict[str, float]:
+    return metrics.snapshot()
@@ -0,0 +1,30 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from orders.domain.model import Order, Ticket
+
+
+def ticket_to_dict(ticket: Ticket) -> dict[str, Any]:
+    return {
+        'id': ticket.id,
+        'event_id': ticket.event_id,
+        'order_id': ticket.order_id,
+        'price': float(ticket.price),
+        'refunded': ticket.refunded,
+    }
+
+
+def order_to_dict(order: Order) -> dict[str, Any]:
+    return {
+        'id': order.id,
+        'order_status': order.order_status.value,
+        'user_id': str(order.user_id),
+        'tickets': [ticket_to_dict(ticket) for ticket in order.tickets],
+    }
+
+
+class OrderResponse(ORJSONResponse):
+    def render(self, content: Order) -> bytes:
+        return orjson.dumps(order_to_dict(content))
@@ -1,24 +1,25 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Response
 
 from orders.domain.commands import CreateBasket, DeleteOrder, UpdateBasket
 from orders.domain.dtos import TicketDTO
 from orders.entrypoints.fastapi.dependencies.bus import get_bus
 from orders.entrypoints.fastapi.dependencies.http import get_user_id
 from orders.entrypoints.fastapi.models import OrderPublic
+from orders.entrypoints.fastapi.responses import OrderResponse
 
 router = APIRouter(tags=['Events'], prefix='/order')
 
 
-@router.post('/')
-async def create_basket(bus: get_bus, user_id: get_user_id) -> OrderPublic:
-    return await bus.handle(CreateBasket(user_id=user_id))
+@router.post('/', response_model=OrderPublic, response_class=OrderResponse)
+async def create_basket(bus: get_bus, user_id: get_user_id) -> Response:
+    return OrderResponse(await bus.handle(CreateBasket(user_id=user_id)))
 
 
-@router.put('/')
-async def update_basket(bus: get_bus, user_id: get_user_id, tickets: list[TicketDTO]) -> OrderPublic:
-    return await bus.handle(UpdateBasket(user_id=user_id, tickets=tickets))
+@router.put('/', response_model=OrderPublic, response_class=OrderResponse)
+async def update_basket(bus: get_bus, user_id: get_user_id, tickets: list[TicketDTO]) -> Response:
+    return OrderResponse(await bus.handle(UpdateBasket(user_id=user_id, tickets=tickets)))
 
 
 @router.delete('/{id}')
@@ -2,5 +2,7 @@ import sys
 
 from loguru import logger
 
+from orders.settings import LOG_JSON, LOG_LEVEL
+
 logger.remove()
-logger.add(sink=sys.stdout, level='DEBUG', colorize=True)
+logger.add(sink=sys.stdout, level=LOG_LEVEL, colorize=not LOG_JSON, serialize=LOG_JSON, enqueue=True)
@@ -0,0 +1,20 @@
+from collections.abc import Callable
+
+_counters: dict[str, float] = {}
+_gauges: dict[str, Callable[[], float]] = {}
+
+
+def inc(name: str, value: float = 1) -> None:
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def gauge(name: str, callback: Callable[[], float]) -> None:
+    _gauges[name] = callback
+
+
+def remove_gauge(name: str) -> None:
+    _gauges.pop(name, None)
+
+
+def snapshot() -> dict[str, float]:
+    return {**_counters, **{name: callback() for name, callback in _gauges.items()}}
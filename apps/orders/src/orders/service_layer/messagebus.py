@@ -18,10 +18,10 @@ class MessageBus:
         self.handlers = handlers
 
     async def handle(self, message: Message) -> Any:  # noqa: ANN401
-        logger.debug(f'handling {type(message).__name__} {message}')
+        logger.debug('handling {} {}', type(message).__name__, message)
         try:
             handler = self.handlers[type(message)]
-            return await handler(message)
+            return await handler(message, uow=self.uow)
         except Exception as error:
-            logger.exception(f'Exception handling {type(message).__name__} {message}. {error}')
+            logger.exception('Exception handling {} {}. {}', type(message).__name__, message, error)
             raise
@@ -6,3 +6,16 @@ POSTGRES_PORT = os.getenv('ORDERS_POSTGRES_PORT', '5432')
 POSTGRES_USER = os.environ['ORDERS_POSTGRES_USER']
 POSTGRES_PASSWORD = os.environ['ORDERS_POSTGRES_PASSWORD']
 POSTGRES_URL = f'postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}'
+POSTGRES_POOL_SIZE = int(os.getenv('ORDERS_POSTGRES_POOL_SIZE', '10'))
+POSTGRES_MAX_OVERFLOW = int(os.getenv('ORDERS_POSTGRES_MAX_OVERFLOW', '10'))
+POSTGRES_POOL_TIMEOUT = float(os.getenv('ORDERS_POSTGRES_POOL_TIMEOUT', '30'))
+POSTGRES_POOL_RECYCLE = int(os.getenv('ORDERS_POSTGRES_POOL_RECYCLE', '1800'))
+POSTGRES_POOL_PRE_PING = os.getenv('ORDERS_POSTGRES_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+POSTGRES_STATEMENT_CACHE_SIZE = int(os.getenv('ORDERS_POSTGRES_STATEMENT_CACHE_SIZE', '500'))
+POSTGRES_STATEMENT_TIMEOUT_MS = int(os.getenv('ORDERS_POSTGRES_STATEMENT_TIMEOUT_MS', '30000'))
+
+LOG_BODY_SAMPLE_RATE = float(os.getenv('LOG_BODY_SAMPLE_RATE', '0'))
+LOG_BODY_MAX_SIZE = int(os.getenv('LOG_BODY_MAX_SIZE', '4096'))
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_JSON = os.getenv('LOG_JSON', 'false').lower() in ('1', 'true', 'yes')
@@ -0,0 +1,63 @@
+import asyncio
+
+import aiosqlite
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from orders import metrics
+from orders.adapters.database import TimedQueuePool
+
+pytestmark = pytest.mark.integration
+
+
+async def test_pool_checkout_waits_and_timeouts_are_reported():
+    before = metrics.snapshot()
+    engine = create_async_engine(
+        'sqlite+aiosqlite://',
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+        pool_logging_name='test',
+    )
+
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+
+    await engine.dispose()
+
+    after = metrics.snapshot()
+    assert after['db_pool_test_checkouts'] - before.get('db_pool_test_checkouts', 0) == 2
+    assert after['db_pool_test_checkout_timeouts'] - before.get('db_pool_test_checkout_timeouts', 0) == 1
+    assert after['db_pool_test_checkout_wait_seconds'] - before.get('db_pool_test_checkout_wait_seconds', 0) >= 0.1
+
+
+async def test_pool_reports_connect_time_apart_from_checkout_wait():
+    async def slow_connect() -> aiosqlite.Connection:
+        await asyncio.sleep(0.2)
+        return await aiosqlite.connect(':memory:')
+
+    before = metrics.snapshot()
+    engine = create_async_engine(
+        'sqlite+aiosqlite://',
+        async_creator=slow_connect,
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_logging_name='slow',
+    )
+
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+
+    await engine.dispose()
+
+    after = metrics.snapshot()
+    assert after['db_pool_slow_connects'] - before.get('db_pool_slow_connects', 0) == 1
+    assert after['db_pool_slow_connect_seconds'] - before.get('db_pool_slow_connect_seconds', 0) >= 0.2
+    assert after['db_pool_slow_checkout_wait_seconds'] - before.get('db_pool_slow_checkout_wait_seconds', 0) < 0.2
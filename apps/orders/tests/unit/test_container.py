@@ -0,0 +1,43 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from orders.entrypoints.fastapi.dependencies.bus import bus
+from orders.entrypoints.fastapi.dependencies.container import Container, create_container
+from orders.service_layer.handlers import HANDLERS
+from orders.service_layer.messagebus import MessageBus
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def container() -> Container:
+    return create_container()
+
+
+@pytest.fixture
+def client(container: Container) -> TestClient:
+    app = FastAPI()
+    app.state.container = container
+
+    @app.get('/')
+    async def index(message_bus: Annotated[MessageBus, Depends(bus)]) -> dict[str, int]:
+        return {
+            'session_factory': id(message_bus.uow.session_factory),  # type: ignore[attr-defined]
+            'handlers': id(message_bus.handlers),
+        }
+
+    return TestClient(app)
+
+
+def test_container_binds_every_handler(container: Container) -> None:
+    assert container.handlers.keys() == HANDLERS.keys()
+
+
+def test_dependencies_are_fetched_from_app_container(client: TestClient, container: Container) -> None:
+    first, second = client.get('/').json(), client.get('/').json()
+
+    assert first['session_factory'] == second['session_factory'] == id(container.session_factory)
+    assert first['handlers'] == second['handlers'] == id(container.handlers)
@@ -0,0 +1,19 @@
+import pytest
+from fastapi.responses import JSONResponse
+
+from orders.domain.model import Order
+from orders.entrypoints.fastapi.models import OrderPublic
+from orders.entrypoints.fastapi.responses import OrderResponse
+
+pytestmark = pytest.mark.unit
+
+
+def test_order_is_byte_identical_to_pydantic_path(fake_orders: list[Order]):
+    for order in fake_orders:
+        for ticket_id, ticket in enumerate(order.tickets, start=1):
+            ticket.id = ticket_id
+        order.tickets[0].refund()
+
+        expected = JSONResponse(OrderPublic.model_validate(order, from_attributes=True).model_dump(mode='json')).body
+
+        assert OrderResponse(order).body == expected